@@ -4,6 +4,7 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
+from .json_utils import safe_json_dumps
 
 @dataclass
 class AuditEvent:
@@ -34,8 +35,8 @@ class AuditLogger:
         )
         
         # Append to log file
-        with open(self.log_file, "a") as f:
-            f.write(json.dumps(asdict(event)) + "\n")
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(safe_json_dumps(asdict(event)) + "\n")
     
     def get_logs(self, user: Optional[str] = None, action: Optional[str] = None, limit: int = 1000) -> pd.DataFrame:
         """Retrieve audit logs with optional filtering"""
@@ -43,7 +44,7 @@ class AuditLogger:
             return pd.DataFrame()
         
         logs = []
-        with open(self.log_file, "r") as f:
+        with open(self.log_file, "r", encoding="utf-8") as f:
             for line in f:
                 try:
                     log_entry = json.loads(line.strip())
@@ -91,7 +92,7 @@ class AuditLogger:
         
         cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
         
-        with open(self.log_file, "r") as f:
+        with open(self.log_file, "r", encoding="utf-8") as f:
             lines = f.readlines()
         
         filtered_lines = []
@@ -104,7 +105,7 @@ class AuditLogger:
             except (json.JSONDecodeError, KeyError, ValueError):
                 continue
         
-        with open(self.log_file, "w") as f:
+        with open(self.log_file, "w", encoding="utf-8") as f:
             f.writelines(filtered_lines)
 
 # Global audit logger instance
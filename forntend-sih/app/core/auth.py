@@ -1,12 +1,19 @@
 import streamlit as st
 import hashlib
 import json
-import pandas as pd
+import os
+import secrets
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 
+# Session tokens stop resolving this long after login
+AUTH_TOKEN_TTL_SECONDS = int(os.getenv("AUTH_TOKEN_TTL_SECONDS", "28800"))
+
 class UserRole(Enum):
     ADMIN = "admin"
     USER = "user"
@@ -21,6 +28,10 @@ class User:
     is_active: bool = True
 
 class AuthManager:
+    # Guards read-modify-write cycles on the users file; shared by every instance
+    # because they all write the same file
+    _lock = threading.Lock()
+    
     def __init__(self):
         self.users_file = Path("app/data/users.json")
         self.users_file.parent.mkdir(parents=True, exist_ok=True)
@@ -66,22 +77,23 @@ class AuthManager:
     
     def authenticate(self, username: str, password: str) -> Optional[User]:
         """Authenticate user with username and password"""
-        users = self._load_users()
-        
-        if username not in users:
-            return None
-        
-        user_data = users[username]
-        if not user_data.get("is_active", True):
-            return None
-        
-        password_hash = self._hash_password(password)
-        if user_data["password_hash"] != password_hash:
-            return None
-        
-        # Update last login
-        user_data["last_login"] = pd.Timestamp.now().isoformat()
-        self._save_users(users)
+        with self._lock:
+            users = self._load_users()
+            
+            if username not in users:
+                return None
+            
+            user_data = users[username]
+            if not user_data.get("is_active", True):
+                return None
+            
+            password_hash = self._hash_password(password)
+            if user_data["password_hash"] != password_hash:
+                return None
+            
+            # Update last login
+            user_data["last_login"] = datetime.now().isoformat()
+            self._save_users(users)
         
         return User(
             username=user_data["username"],
@@ -93,21 +105,22 @@ class AuthManager:
     
     def create_user(self, username: str, email: str, password: str, role: UserRole) -> bool:
         """Create a new user"""
-        users = self._load_users()
-        
-        if username in users:
-            return False
-        
-        users[username] = {
-            "username": username,
-            "email": email,
-            "password_hash": self._hash_password(password),
-            "role": role.value,
-            "created_at": pd.Timestamp.now().isoformat(),
-            "is_active": True
-        }
-        
-        self._save_users(users)
+        with self._lock:
+            users = self._load_users()
+            
+            if username in users:
+                return False
+            
+            users[username] = {
+                "username": username,
+                "email": email,
+                "password_hash": self._hash_password(password),
+                "role": role.value,
+                "created_at": datetime.now().isoformat(),
+                "is_active": True
+            }
+            
+            self._save_users(users)
         return True
     
     def get_user(self, username: str) -> Optional[User]:
@@ -144,22 +157,89 @@ class AuthManager:
     
     def update_user_status(self, username: str, is_active: bool) -> bool:
         """Update user active status"""
-        users = self._load_users()
-        
-        if username not in users:
-            return False
-        
-        users[username]["is_active"] = is_active
-        self._save_users(users)
+        with self._lock:
+            users = self._load_users()
+            
+            if username not in users:
+                return False
+            
+            users[username]["is_active"] = is_active
+            self._save_users(users)
         return True
 
+@st.cache_resource
+def get_auth_manager() -> AuthManager:
+    """Process-wide AuthManager shared by the login and admin pages"""
+    return AuthManager()
+
+class _TokenStore:
+    """Session tokens mapped to (username, expiry timestamp), shared by every session"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens: Dict[str, tuple] = {}
+
+@st.cache_resource
+def _auth_tokens() -> _TokenStore:
+    """Process-wide session token store; use its lock for every access"""
+    return _TokenStore()
+
+@st.cache_data(ttl="30s", max_entries=64, show_spinner=False)
+def _load_account(username: str, users_version: int) -> Optional[User]:
+    """Stored account for a username, re-read whenever users.json changes"""
+    return get_auth_manager().get_user(username)
+
+def _users_version() -> int:
+    users_file = get_auth_manager().users_file
+    return users_file.stat().st_mtime_ns if users_file.exists() else 0
+
+def login_user(user: User) -> str:
+    """Store an authenticated user in the session and issue an expiring session token"""
+    store = _auth_tokens()
+    now = time.time()
+    token = secrets.token_urlsafe(32)
+    with store.lock:
+        for expired, (_, expires_at) in list(store.tokens.items()):
+            if expires_at <= now:
+                del store.tokens[expired]
+        store.tokens[token] = (user.username, now + AUTH_TOKEN_TTL_SECONDS)
+    st.session_state.user = user
+    st.session_state.auth_token = token
+    return token
+
+def logout_user():
+    """Clear the current session and revoke its token"""
+    token = st.session_state.pop("auth_token", None)
+    if token:
+        store = _auth_tokens()
+        with store.lock:
+            store.tokens.pop(token, None)
+    st.session_state.pop("user", None)
+
 def get_current_user() -> Optional[User]:
-    """Get current logged in user from session state"""
-    return st.session_state.get("user")
+    """Get the logged in user for this session's token, as currently stored in users.json"""
+    token = st.session_state.get("auth_token")
+    entry = None
+    if token:
+        store = _auth_tokens()
+        with store.lock:
+            entry = store.tokens.get(token)
+    if entry is None or entry[1] <= time.time():
+        logout_user()
+        return None
+    
+    # Deactivation and role changes made since login apply immediately
+    user = _load_account(entry[0], _users_version())
+    if user is None or not user.is_active:
+        logout_user()
+        return None
+    
+    st.session_state.user = user
+    return user
 
 def is_authenticated() -> bool:
     """Check if user is authenticated"""
-    return "user" in st.session_state and st.session_state.user is not None
+    return get_current_user() is not None
 
 def is_admin() -> bool:
     """Check if current user is admin"""
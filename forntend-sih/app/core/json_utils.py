@@ -3,18 +3,80 @@ JSON Utilities Module
 Provides consistent JSON serialization with datetime handling
 """
 
+import io
 import json
 from datetime import datetime
-from typing import Any, Dict, List
+from enum import Enum
+from typing import Any, Dict, Iterable, List
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects"""
+    """Custom JSON encoder that handles datetime and Enum objects"""
     
     def default(self, obj: Any) -> Any:
         if isinstance(obj, datetime):
             return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
         return super().default(obj)
 
+def safe_json_bytes(obj: Any, **kwargs) -> bytes:
+    """
+    Serialize objects to UTF-8 JSON bytes, handling datetime and Enum objects
+    
+    Uses orjson when it is installed and only ``indent`` (None or 2) is
+    requested; anything else, or anything orjson can't encode, goes
+    through the standard library encoder.
+    
+    Args:
+        obj: Object to serialize
+        **kwargs: Additional arguments for json.dumps
+    
+    Returns:
+        JSON bytes, ready for st.download_button or a binary file
+    """
+    if ORJSON_AVAILABLE and set(kwargs) <= {"indent"} and kwargs.get("indent") in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent") == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            pass
+    return json.dumps(obj, cls=DateTimeEncoder, **kwargs).encode("utf-8")
+
+def safe_json_stream(header: Dict[str, Any], key: str, rows: Iterable[Any]) -> bytes:
+    """
+    Encode ``{**header, key: [*rows]}`` compactly, one row at a time
+    
+    Rows are written into a BytesIO as they are produced, so a generator
+    is never materialized as a list and no pretty-printed copy is built.
+    
+    Args:
+        header: Top-level fields written before the array
+        key: Name of the array field
+        rows: Iterable of JSON-serializable rows
+    
+    Returns:
+        JSON bytes
+    """
+    buf = io.BytesIO()
+    buf.write(safe_json_bytes(header)[:-1])
+    if header:
+        buf.write(b",")
+    buf.write(safe_json_bytes(key) + b":[")
+    for i, row in enumerate(rows):
+        if i:
+            buf.write(b",")
+        buf.write(safe_json_bytes(row))
+    buf.write(b"]}")
+    return buf.getvalue()
+
 def safe_json_dumps(obj: Any, **kwargs) -> str:
     """
     Safely serialize objects to JSON, handling datetime objects
@@ -26,6 +88,8 @@ def safe_json_dumps(obj: Any, **kwargs) -> str:
     Returns:
         JSON string
     """
+    if ORJSON_AVAILABLE and set(kwargs) <= {"indent"}:
+        return safe_json_bytes(obj, **kwargs).decode("utf-8")
     return json.dumps(obj, cls=DateTimeEncoder, **kwargs)
 
 def safe_json_dump(obj: Any, fp, **kwargs) -> None:
@@ -101,6 +101,7 @@ class LabelGenerator:
         self.labels_file = Path("app/data/labels.json")
         self.labels_file.parent.mkdir(parents=True, exist_ok=True)
         self.labels = self._load_labels()
+        self.labels_by_id = {label.label_id: label for label in self.labels}
         
         # Define mandatory elements for Legal Metrology compliance
         self.mandatory_elements = {
@@ -243,6 +244,7 @@ class LabelGenerator:
         self._perform_compliance_check(label, created_by)
         
         self.labels.append(label)
+        self.labels_by_id[label.label_id] = label
         self._save_labels()
         
         return label
@@ -443,10 +445,7 @@ class LabelGenerator:
     
     def get_label(self, label_id: str) -> Optional[LabelDesign]:
         """Get label by ID"""
-        for label in self.labels:
-            if label.label_id == label_id:
-                return label
-        return None
+        return self.labels_by_id.get(label_id)
     
     def get_labels_by_product(self, product_sku: str) -> List[LabelDesign]:
         """Get labels by product SKU"""
@@ -3,14 +3,24 @@ Physical System Integration Module
 Handles integration with printing and vision systems for end-to-end compliance assurance
 """
 
+import atexit
 import json
+import os
+import threading
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from .json_utils import safe_json_dump, safe_json_dumps
 
+# Changes are written this long after the first unsaved one, so bursts share a write
+SAVE_DELAY_SECONDS = float(os.getenv("PHYSICAL_SAVE_DELAY_SECONDS", "0.5"))
+
+# Print job changes are appended to a log and folded into the snapshot once it holds this many
+PRINT_JOB_LOG_COMPACT_EVENTS = int(os.getenv("PRINT_JOB_LOG_COMPACT_EVENTS", "10000"))
+
 class IntegrationStatus(Enum):
     """Integration status enumeration"""
     DISCONNECTED = "DISCONNECTED"
@@ -86,6 +96,11 @@ class PhysicalDevice:
             self.config = {}
         if self.installed_date is None:
             self.installed_date = datetime.now().isoformat()
+    
+    @property
+    def heartbeat_short(self) -> str:
+        """Last heartbeat to the second, for display"""
+        return self.last_heartbeat[:19] if self.last_heartbeat else ""
 
 @dataclass
 class PrintJob:
@@ -121,6 +136,19 @@ class PrintJob:
     def __post_init__(self):
         if self.notes is None:
             self.notes = []
+    
+    @cached_property
+    def created_short(self) -> str:
+        """Creation time to the second, for display"""
+        return self.created_date[:19] if self.created_date else ""
+    
+    @property
+    def started_short(self) -> str:
+        return self.started_time[:19] if self.started_time else ""
+    
+    @property
+    def completed_short(self) -> str:
+        return self.completed_time[:19] if self.completed_time else ""
 
 @dataclass
 class VisionCheck:
@@ -161,6 +189,11 @@ class VisionCheck:
             self.compliance_analysis = {}
         if self.notes is None:
             self.notes = []
+    
+    @cached_property
+    def performed_short(self) -> str:
+        """Check time to the second, for display"""
+        return self.performed_date[:19] if self.performed_date else ""
 
 class PhysicalIntegrationManager:
     """Manages integration with physical systems"""
@@ -168,16 +201,37 @@ class PhysicalIntegrationManager:
     def __init__(self):
         self.devices_file = Path("app/data/physical_devices.json")
         self.print_jobs_file = Path("app/data/print_jobs.json")
+        self.print_jobs_log = Path("app/data/print_jobs.jsonl")
         self.vision_checks_file = Path("app/data/vision_checks.json")
         
         # Create directories if they don't exist
         for file_path in [self.devices_file, self.print_jobs_file, self.vision_checks_file]:
             file_path.parent.mkdir(parents=True, exist_ok=True)
         
+        self._print_log_events = 0
+        self._print_log_lock = threading.Lock()
+        
         self.devices = self._load_devices()
         self.print_jobs = self._load_print_jobs()
         self.vision_checks = self._load_vision_checks()
         
+        # Bumped on every change so callers can cache reads between changes
+        self.devices_version = 0
+        self.print_jobs_version = 0
+        self.vision_version = 0
+        self._print_index_version = None
+        self._vision_index_version = None
+        
+        # Guards list appends and whole-list reads shared by sessions and the save timer
+        self._lock = threading.RLock()
+        
+        # Pending writes, flushed by a timer or at interpreter exit
+        self._save_lock = threading.Lock()
+        self._dirty = set()
+        self._dirty_print_jobs = {}
+        self._save_timer = None
+        atexit.register(self.flush)
+        
         # Initialize default devices if none exist
         if not self.devices:
             self._initialize_default_devices()
@@ -202,19 +256,30 @@ class PhysicalIntegrationManager:
             return []
     
     def _load_print_jobs(self) -> List[PrintJob]:
-        """Load print jobs from file"""
-        if not self.print_jobs_file.exists():
-            return []
+        """Load the print job snapshot and replay the job log on top of it"""
+        jobs = {}
         
         try:
-            with open(self.print_jobs_file, 'r') as f:
-                data = json.load(f)
-                jobs = []
-                for item in data:
-                    # Convert enum values back to enum objects
-                    item['status'] = PrintStatus(item['status'])
-                    jobs.append(PrintJob(**item))
-                return jobs
+            if self.print_jobs_file.exists():
+                with open(self.print_jobs_file, 'r') as f:
+                    for item in json.load(f):
+                        jobs[item['job_id']] = item
+            
+            if self.print_jobs_log.exists():
+                with open(self.print_jobs_log, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                        except json.JSONDecodeError:
+                            # A line cut short by a crash mid-append
+                            continue
+                        jobs[item['job_id']] = item
+                        self._print_log_events += 1
+            
+            for item in jobs.values():
+                # Convert enum values back to enum objects
+                item['status'] = PrintStatus(item['status'])
+            return [PrintJob(**item) for item in jobs.values()]
         except Exception as e:
             print(f"Error loading print jobs: {e}")
             return []
@@ -237,55 +302,129 @@ class PhysicalIntegrationManager:
             print(f"Error loading vision checks: {e}")
             return []
     
+    @property
+    def version(self) -> tuple:
+        """Combined change token for devices, print jobs and vision checks"""
+        return (self.devices_version, self.print_jobs_version, self.vision_version)
+    
     def _save_devices(self):
         """Save physical devices to file"""
         try:
             # Convert devices to dictionaries
-            data = []
-            for device in self.devices:
-                device_dict = asdict(device)
-                # Convert enums to string values
-                device_dict['device_type'] = device.device_type.value
-                device_dict['status'] = device.status.value
-                data.append(device_dict)
+            with self._lock:
+                data = []
+                for device in self.devices:
+                    device_dict = asdict(device)
+                    # Convert enums to string values
+                    device_dict['device_type'] = device.device_type.value
+                    device_dict['status'] = device.status.value
+                    data.append(device_dict)
             
             with open(self.devices_file, 'w') as f:
                 safe_json_dump(data, f, indent=2)
         except Exception as e:
             print(f"Error saving physical devices: {e}")
     
+    @staticmethod
+    def _print_job_dict(job: PrintJob) -> Dict[str, Any]:
+        """Print job as a JSON-ready dictionary"""
+        job_dict = asdict(job)
+        # Convert enums to string values
+        job_dict['status'] = job.status.value
+        return job_dict
+    
     def _save_print_jobs(self):
-        """Save print jobs to file"""
+        """Write the print job snapshot and clear the job log it now covers"""
         try:
-            # Convert print jobs to dictionaries
-            data = []
-            for job in self.print_jobs:
-                job_dict = asdict(job)
-                # Convert enums to string values
-                job_dict['status'] = job.status.value
-                data.append(job_dict)
-            
-            with open(self.print_jobs_file, 'w') as f:
-                safe_json_dump(data, f, indent=2)
+            with self._print_log_lock:
+                with self._lock:
+                    data = [self._print_job_dict(job) for job in self.print_jobs]
+                
+                # Replace the snapshot whole before dropping the log, so a failed
+                # write leaves the old snapshot and its log to rebuild from
+                tmp_file = self.print_jobs_file.with_name(self.print_jobs_file.name + ".tmp")
+                with open(tmp_file, 'w') as f:
+                    safe_json_dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.print_jobs_file)
+                self.print_jobs_log.unlink(missing_ok=True)
+                self._print_log_events = 0
         except Exception as e:
             print(f"Error saving print jobs: {e}")
     
+    def _append_print_jobs(self, jobs: List[PrintJob]):
+        """Append the current state of changed print jobs to the job log"""
+        try:
+            with self._print_log_lock:
+                with self._lock:
+                    lines = [safe_json_dumps(self._print_job_dict(job)) + "\n" for job in jobs]
+                
+                with open(self.print_jobs_log, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+                self._print_log_events += len(lines)
+                compact = self._print_log_events >= PRINT_JOB_LOG_COMPACT_EVENTS
+        except Exception as e:
+            print(f"Error appending print jobs: {e}")
+            return
+        
+        if compact:
+            self._save_print_jobs()
+    
     def _save_vision_checks(self):
         """Save vision checks to file"""
         try:
             # Convert vision checks to dictionaries
-            data = []
-            for check in self.vision_checks:
-                check_dict = asdict(check)
-                # Convert enums to string values
-                check_dict['status'] = check.status.value
-                data.append(check_dict)
+            with self._lock:
+                data = []
+                for check in self.vision_checks:
+                    check_dict = asdict(check)
+                    # Convert enums to string values
+                    check_dict['status'] = check.status.value
+                    data.append(check_dict)
             
             with open(self.vision_checks_file, 'w') as f:
                 safe_json_dump(data, f, indent=2)
         except Exception as e:
             print(f"Error saving vision checks: {e}")
     
+    def _schedule_save(self, kind: str, job: Optional[PrintJob] = None):
+        """Record a change to devices, print_jobs (with the changed job) or vision_checks and queue its write"""
+        # Callers hold the lock across the mutation and this call, so no index is
+        # built from changed data and tagged with the previous version
+        with self._lock:
+            if kind == "devices":
+                self.devices_version += 1
+            elif kind == "print_jobs":
+                self.print_jobs_version += 1
+            else:
+                self.vision_version += 1
+        
+        with self._save_lock:
+            self._dirty.add(kind)
+            if job is not None:
+                self._dirty_print_jobs[job.job_id] = job
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self):
+        """Write every collection changed since the last flush"""
+        with self._save_lock:
+            dirty, self._dirty = self._dirty, set()
+            dirty_jobs, self._dirty_print_jobs = self._dirty_print_jobs, {}
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        
+        if "devices" in dirty:
+            self._save_devices()
+        if dirty_jobs:
+            self._append_print_jobs(list(dirty_jobs.values()))
+        if "vision_checks" in dirty:
+            self._save_vision_checks()
+    
     def _initialize_default_devices(self):
         """Initialize default physical devices"""
         default_devices = [
@@ -332,7 +471,7 @@ class PhysicalIntegrationManager:
         ]
         
         self.devices.extend(default_devices)
-        self._save_devices()
+        self._schedule_save("devices")
     
     def generate_job_id(self) -> str:
         """Generate unique job ID"""
@@ -351,30 +490,31 @@ class PhysicalIntegrationManager:
                    capabilities: List[str] = None, config: Dict[str, Any] = None) -> PhysicalDevice:
         """Add new physical device"""
         
-        device_id = f"{device_type.value}001"  # Simplified ID generation
-        if any(d.device_id == device_id for d in self.devices):
-            # Find next available ID
-            count = 1
-            while any(d.device_id == f"{device_type.value}{count:03d}" for d in self.devices):
-                count += 1
-            device_id = f"{device_type.value}{count:03d}"
-        
-        device = PhysicalDevice(
-            device_id=device_id,
-            device_name=device_name,
-            device_type=device_type,
-            manufacturer=manufacturer,
-            model=model,
-            status=IntegrationStatus.DISCONNECTED,
-            ip_address=ip_address,
-            port=port,
-            capabilities=capabilities or [],
-            config=config or {}
-        )
-        
-        self.devices.append(device)
-        self._save_devices()
-        
+        with self._lock:
+            device_id = f"{device_type.value}001"  # Simplified ID generation
+            if any(d.device_id == device_id for d in self.devices):
+                # Find next available ID
+                count = 1
+                while any(d.device_id == f"{device_type.value}{count:03d}" for d in self.devices):
+                    count += 1
+                device_id = f"{device_type.value}{count:03d}"
+            
+            device = PhysicalDevice(
+                device_id=device_id,
+                device_name=device_name,
+                device_type=device_type,
+                manufacturer=manufacturer,
+                model=model,
+                status=IntegrationStatus.DISCONNECTED,
+                ip_address=ip_address,
+                port=port,
+                capabilities=capabilities or [],
+                config=config or {}
+            )
+            
+            self.devices.append(device)
+            self._schedule_save("devices")
+            
         return device
     
     def connect_device(self, device_id: str) -> bool:
@@ -383,19 +523,21 @@ class PhysicalIntegrationManager:
         if not device:
             return False
         
-        device.status = IntegrationStatus.CONNECTING
-        self._save_devices()
+        with self._lock:
+            device.status = IntegrationStatus.CONNECTING
+            self._schedule_save("devices")
         
         # Simulate connection process
         import time
         time.sleep(1)  # Simulate connection delay
         
-        device.status = IntegrationStatus.CONNECTED
-        device.last_heartbeat = datetime.now().isoformat()
-        device.error_count = 0
-        device.last_error = None
-        
-        self._save_devices()
+        with self._lock:
+            device.status = IntegrationStatus.CONNECTED
+            device.last_heartbeat = datetime.now().isoformat()
+            device.error_count = 0
+            device.last_error = None
+            
+            self._schedule_save("devices")
         return True
     
     def disconnect_device(self, device_id: str) -> bool:
@@ -404,37 +546,39 @@ class PhysicalIntegrationManager:
         if not device:
             return False
         
-        device.status = IntegrationStatus.DISCONNECTED
-        device.last_heartbeat = None
-        
-        self._save_devices()
+        with self._lock:
+            device.status = IntegrationStatus.DISCONNECTED
+            device.last_heartbeat = None
+            
+            self._schedule_save("devices")
         return True
     
     def create_print_job(self, label_id: str, product_sku: str, device_id: str,
                         created_by: str, copies: int = 1, **kwargs) -> PrintJob:
         """Create new print job"""
         
-        job_id = self.generate_job_id()
-        
-        job = PrintJob(
-            job_id=job_id,
-            label_id=label_id,
-            product_sku=product_sku,
-            device_id=device_id,
-            status=PrintStatus.PENDING,
-            created_by=created_by,
-            created_date=datetime.now().isoformat(),
-            copies=copies,
-            print_format=kwargs.get('print_format', 'PNG'),
-            resolution=kwargs.get('resolution', 300),
-            color_mode=kwargs.get('color_mode', 'RGB'),
-            priority=kwargs.get('priority', 1),
-            scheduled_time=kwargs.get('scheduled_time')
-        )
-        
-        self.print_jobs.append(job)
-        self._save_print_jobs()
-        
+        with self._lock:
+            job_id = self.generate_job_id()
+            
+            job = PrintJob(
+                job_id=job_id,
+                label_id=label_id,
+                product_sku=product_sku,
+                device_id=device_id,
+                status=PrintStatus.PENDING,
+                created_by=created_by,
+                created_date=datetime.now().isoformat(),
+                copies=copies,
+                print_format=kwargs.get('print_format', 'PNG'),
+                resolution=kwargs.get('resolution', 300),
+                color_mode=kwargs.get('color_mode', 'RGB'),
+                priority=kwargs.get('priority', 1),
+                scheduled_time=kwargs.get('scheduled_time')
+            )
+            
+            self.print_jobs.append(job)
+            self._schedule_save("print_jobs", job)
+            
         return job
     
     def execute_print_job(self, job_id: str) -> bool:
@@ -445,53 +589,69 @@ class PhysicalIntegrationManager:
         
         device = self.get_device(job.device_id)
         if not device or device.status != IntegrationStatus.CONNECTED:
-            job.status = PrintStatus.FAILED
-            job.error_message = "Device not connected"
-            self._save_print_jobs()
+            with self._lock:
+                job.status = PrintStatus.FAILED
+                job.error_message = "Device not connected"
+                self._schedule_save("print_jobs", job)
             return False
         
         # Update job status
-        job.status = PrintStatus.PRINTING
-        job.started_time = datetime.now().isoformat()
-        self._save_print_jobs()
+        with self._lock:
+            job.status = PrintStatus.PRINTING
+            job.started_time = datetime.now().isoformat()
+            self._schedule_save("print_jobs", job)
         
         # Simulate printing process
         import time
         time.sleep(2)  # Simulate printing time
         
         # Complete job
-        job.status = PrintStatus.COMPLETED
-        job.completed_time = datetime.now().isoformat()
-        job.success_count = job.copies
-        job.failure_count = 0
-        
-        # Add completion note
-        job.notes.append({
-            "timestamp": datetime.now().isoformat(),
-            "user": "system",
-            "note": f"Print job completed successfully. Printed {job.copies} copies."
-        })
-        
-        self._save_print_jobs()
+        with self._lock:
+            job.status = PrintStatus.COMPLETED
+            job.completed_time = datetime.now().isoformat()
+            job.success_count = job.copies
+            job.failure_count = 0
+            
+            # Add completion note
+            job.notes.append({
+                "timestamp": datetime.now().isoformat(),
+                "user": "system",
+                "note": f"Print job completed successfully. Printed {job.copies} copies."
+            })
+            
+            self._schedule_save("print_jobs", job)
+        return True
+    
+    def reset_print_job(self, job_id: str) -> bool:
+        """Put a failed print job back in the queue"""
+        job = self.get_print_job(job_id)
+        if not job:
+            return False
+        
+        with self._lock:
+            job.status = PrintStatus.PENDING
+            job.error_message = None
+            self._schedule_save("print_jobs", job)
         return True
     
     def create_vision_check(self, product_sku: str, image_path: str, performed_by: str) -> VisionCheck:
         """Create new vision check"""
         
-        check_id = self.generate_check_id()
-        
-        check = VisionCheck(
-            check_id=check_id,
-            product_sku=product_sku,
-            image_path=image_path,
-            status=VisionCheckStatus.PENDING,
-            performed_by=performed_by,
-            performed_date=datetime.now().isoformat()
-        )
-        
-        self.vision_checks.append(check)
-        self._save_vision_checks()
-        
+        with self._lock:
+            check_id = self.generate_check_id()
+            
+            check = VisionCheck(
+                check_id=check_id,
+                product_sku=product_sku,
+                image_path=image_path,
+                status=VisionCheckStatus.PENDING,
+                performed_by=performed_by,
+                performed_date=datetime.now().isoformat()
+            )
+            
+            self.vision_checks.append(check)
+            self._schedule_save("vision_checks")
+            
         return check
     
     def execute_vision_check(self, check_id: str) -> bool:
@@ -501,8 +661,9 @@ class PhysicalIntegrationManager:
             return False
         
         # Update check status
-        check.status = VisionCheckStatus.IN_PROGRESS
-        self._save_vision_checks()
+        with self._lock:
+            check.status = VisionCheckStatus.IN_PROGRESS
+            self._schedule_save("vision_checks")
         
         # Simulate vision analysis
         import time
@@ -510,56 +671,68 @@ class PhysicalIntegrationManager:
         time.sleep(3)  # Simulate analysis time
         
         # Simulate analysis results
-        check.compliance_score = random.uniform(75, 95)
-        check.confidence_level = random.uniform(80, 95)
-        check.image_quality_score = random.uniform(70, 90)
-        check.lighting_score = random.uniform(75, 85)
-        check.sharpness_score = random.uniform(80, 95)
-        
-        # Simulate text recognition
-        check.text_recognition_results = {
-            "mrp_detected": random.choice([True, False]),
-            "quantity_detected": random.choice([True, False]),
-            "manufacturer_detected": random.choice([True, False]),
-            "confidence": random.uniform(75, 95)
-        }
-        
-        # Simulate element detection
-        check.element_detection_results = {
-            "barcode_detected": random.choice([True, False]),
-            "qr_code_detected": random.choice([True, False]),
-            "text_elements": random.randint(3, 8),
-            "layout_score": random.uniform(70, 90)
-        }
-        
-        # Simulate compliance analysis
-        check.compliance_analysis = {
-            "mrp_compliance": check.compliance_score > 80,
-            "quantity_compliance": check.compliance_score > 75,
-            "labeling_compliance": check.compliance_score > 85,
-            "overall_compliance": check.compliance_score > 80
-        }
+        with self._lock:
+            check.compliance_score = random.uniform(75, 95)
+            check.confidence_level = random.uniform(80, 95)
+            check.image_quality_score = random.uniform(70, 90)
+            check.lighting_score = random.uniform(75, 85)
+            check.sharpness_score = random.uniform(80, 95)
+            
+            # Simulate text recognition
+            check.text_recognition_results = {
+                "mrp_detected": random.choice([True, False]),
+                "quantity_detected": random.choice([True, False]),
+                "manufacturer_detected": random.choice([True, False]),
+                "confidence": random.uniform(75, 95)
+            }
+            
+            # Simulate element detection
+            check.element_detection_results = {
+                "barcode_detected": random.choice([True, False]),
+                "qr_code_detected": random.choice([True, False]),
+                "text_elements": random.randint(3, 8),
+                "layout_score": random.uniform(70, 90)
+            }
+            
+            # Simulate compliance analysis
+            check.compliance_analysis = {
+                "mrp_compliance": check.compliance_score > 80,
+                "quantity_compliance": check.compliance_score > 75,
+                "labeling_compliance": check.compliance_score > 85,
+                "overall_compliance": check.compliance_score > 80
+            }
+            
+            # Determine final status
+            if check.compliance_score >= 80:
+                check.status = VisionCheckStatus.PASSED
+                check.detected_issues = []
+            else:
+                check.status = VisionCheckStatus.FAILED
+                check.detected_issues = [
+                    "Low compliance score detected",
+                    "Some text elements not clearly visible",
+                    "Label positioning may need adjustment"
+                ]
+            
+            # Add analysis note
+            check.notes.append({
+                "timestamp": datetime.now().isoformat(),
+                "user": "system",
+                "note": f"Vision check completed. Compliance score: {check.compliance_score:.1f}%"
+            })
+            
+            self._schedule_save("vision_checks")
+        return True
+    
+    def reset_vision_check(self, check_id: str) -> bool:
+        """Put a failed vision check back in the queue"""
+        check = self.get_vision_check(check_id)
+        if not check:
+            return False
         
-        # Determine final status
-        if check.compliance_score >= 80:
-            check.status = VisionCheckStatus.PASSED
-            check.detected_issues = []
-        else:
-            check.status = VisionCheckStatus.FAILED
-            check.detected_issues = [
-                "Low compliance score detected",
-                "Some text elements not clearly visible",
-                "Label positioning may need adjustment"
-            ]
-        
-        # Add analysis note
-        check.notes.append({
-            "timestamp": datetime.now().isoformat(),
-            "user": "system",
-            "note": f"Vision check completed. Compliance score: {check.compliance_score:.1f}%"
-        })
-        
-        self._save_vision_checks()
+        with self._lock:
+            check.status = VisionCheckStatus.PENDING
+            self._schedule_save("vision_checks")
         return True
     
     def get_device(self, device_id: str) -> Optional[PhysicalDevice]:
@@ -591,13 +764,85 @@ class PhysicalIntegrationManager:
         """Get connected devices"""
         return [device for device in self.devices if device.status == IntegrationStatus.CONNECTED]
     
+    def _print_job_index(self):
+        """Print jobs grouped by status and by device, rebuilt after each save"""
+        with self._lock:
+            version = self.print_jobs_version
+            if self._print_index_version != version:
+                by_status, by_device = {}, {}
+                for job in self.print_jobs:
+                    by_status.setdefault(job.status, []).append(job)
+                    by_device.setdefault(job.device_id, []).append(job)
+                self._jobs_by_status, self._jobs_by_device = by_status, by_device
+                self._print_index_version = version
+            return self._jobs_by_status, self._jobs_by_device
+    
+    def _vision_check_index(self):
+        """Vision checks grouped by status and by product SKU, rebuilt after each save"""
+        with self._lock:
+            version = self.vision_version
+            if self._vision_index_version != version:
+                by_status, by_sku = {}, {}
+                for check in self.vision_checks:
+                    by_status.setdefault(check.status, []).append(check)
+                    by_sku.setdefault(check.product_sku, []).append(check)
+                self._checks_by_status, self._checks_by_sku = by_status, by_sku
+                self._vision_index_version = version
+            return self._checks_by_status, self._checks_by_sku
+    
+    def get_print_jobs(self, status: Optional[PrintStatus] = None,
+                       device_id: Optional[str] = None) -> List[PrintJob]:
+        """Get print jobs, optionally filtered by status and/or device"""
+        if status is None and device_id is None:
+            return list(self.print_jobs)
+        
+        by_status, by_device = self._print_job_index()
+        if device_id is None:
+            return list(by_status.get(status, []))
+        if status is None:
+            return list(by_device.get(device_id, []))
+        
+        status_jobs = by_status.get(status, [])
+        device_jobs = by_device.get(device_id, [])
+        if len(status_jobs) <= len(device_jobs):
+            return [job for job in status_jobs if job.device_id == device_id]
+        return [job for job in device_jobs if job.status == status]
+    
+    def get_vision_checks(self, status: Optional[VisionCheckStatus] = None,
+                          product_sku: Optional[str] = None) -> List[VisionCheck]:
+        """Get vision checks, optionally filtered by status and/or product SKU"""
+        if status is None and product_sku is None:
+            return list(self.vision_checks)
+        
+        by_status, by_sku = self._vision_check_index()
+        if product_sku is None:
+            return list(by_status.get(status, []))
+        if status is None:
+            return list(by_sku.get(product_sku, []))
+        
+        status_checks = by_status.get(status, [])
+        sku_checks = by_sku.get(product_sku, [])
+        if len(status_checks) <= len(sku_checks):
+            return [check for check in status_checks if check.product_sku == product_sku]
+        return [check for check in sku_checks if check.status == status]
+    
     def get_print_jobs_by_status(self, status: PrintStatus) -> List[PrintJob]:
         """Get print jobs by status"""
-        return [job for job in self.print_jobs if job.status == status]
+        return self.get_print_jobs(status=status)
     
     def get_vision_checks_by_status(self, status: VisionCheckStatus) -> List[VisionCheck]:
         """Get vision checks by status"""
-        return [check for check in self.vision_checks if check.status == status]
+        return self.get_vision_checks(status=status)
+    
+    def count_print_jobs_by_status(self, status: PrintStatus) -> int:
+        """Count print jobs with a status without copying them"""
+        by_status, _ = self._print_job_index()
+        return len(by_status.get(status, ()))
+    
+    def count_vision_checks_by_status(self, status: VisionCheckStatus) -> int:
+        """Count vision checks with a status without copying them"""
+        by_status, _ = self._vision_check_index()
+        return len(by_status.get(status, ()))
     
     def get_integration_statistics(self) -> Dict[str, Any]:
         """Get physical integration statistics"""
@@ -619,20 +864,20 @@ class PhysicalIntegrationManager:
         
         job_status_counts = {}
         for status in PrintStatus:
-            job_status_counts[status.value] = len(self.get_print_jobs_by_status(status))
+            job_status_counts[status.value] = self.count_print_jobs_by_status(status)
         
         # Vision check statistics
         total_checks = len(self.vision_checks)
         
         check_status_counts = {}
         for status in VisionCheckStatus:
-            check_status_counts[status.value] = len(self.get_vision_checks_by_status(status))
+            check_status_counts[status.value] = self.count_vision_checks_by_status(status)
         
         # Calculate success rates
-        completed_jobs = len(self.get_print_jobs_by_status(PrintStatus.COMPLETED))
+        completed_jobs = job_status_counts[PrintStatus.COMPLETED.value]
         print_success_rate = (completed_jobs / total_jobs) * 100 if total_jobs > 0 else 0
         
-        passed_checks = len(self.get_vision_checks_by_status(VisionCheckStatus.PASSED))
+        passed_checks = check_status_counts[VisionCheckStatus.PASSED.value]
         vision_success_rate = (passed_checks / total_checks) * 100 if total_checks > 0 else 0
         
         return {
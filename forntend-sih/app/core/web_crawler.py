@@ -7,6 +7,8 @@ import requests
 import json
 import time
 import logging
+from collections import Counter
+from operator import attrgetter
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from urllib.parse import urljoin, urlparse, parse_qs
@@ -975,15 +977,20 @@ class EcommerceCrawler:
             'data_completeness': {}
         }
         
-        # Platform distribution
+        # Platform, category and data-completeness counts in a single pass
+        fields = ('title', 'brand', 'price', 'net_quantity', 'manufacturer', 'country_of_origin')
+        get_fields = attrgetter(*fields)
+        platform_counts = Counter()
+        category_counts = Counter()
+        complete_counts = [0] * len(fields)
         for product in products:
-            platform = product.platform or 'unknown'
-            stats['platforms'][platform] = stats['platforms'].get(platform, 0) + 1
-        
-        # Category distribution
-        for product in products:
-            category = product.category or 'uncategorized'
-            stats['categories'][category] = stats['categories'].get(category, 0) + 1
+            platform_counts[product.platform or 'unknown'] += 1
+            category_counts[product.category or 'uncategorized'] += 1
+            for i, value in enumerate(get_fields(product)):
+                if value is not None:
+                    complete_counts[i] += 1
+        stats['platforms'] = dict(platform_counts)
+        stats['categories'] = dict(category_counts)
         
         # Price statistics
         prices = [p.price for p in products if p.price is not None]
@@ -996,9 +1003,7 @@ class EcommerceCrawler:
             }
         
         # Data completeness
-        fields = ['title', 'brand', 'price', 'net_quantity', 'manufacturer', 'country_of_origin']
-        for field in fields:
-            complete_count = sum(1 for p in products if getattr(p, field) is not None)
+        for field, complete_count in zip(fields, complete_counts):
             stats['data_completeness'][field] = {
                 'complete': complete_count,
                 'percentage': (complete_count / len(products)) * 100
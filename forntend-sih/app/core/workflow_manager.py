@@ -3,13 +3,13 @@ Workflow and Approval Trail Management System
 Handles role-based workflows, approvals, and audit trails for Legal Metrology compliance
 """
 
-import json
+import sqlite3
+import threading
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass, asdict
-from .json_utils import safe_json_dump, safe_json_dumps
+import msgspec
 
 class WorkflowStatus(Enum):
     """Workflow status enumeration"""
@@ -38,8 +38,7 @@ class WorkflowType(Enum):
     REGULATORY_UPDATE = "REGULATORY_UPDATE"
     SYSTEM_CONFIGURATION = "SYSTEM_CONFIGURATION"
 
-@dataclass
-class WorkflowStep:
+class WorkflowStep(msgspec.Struct):
     """Individual workflow step"""
     step_id: str
     step_name: str
@@ -50,14 +49,9 @@ class WorkflowStep:
     started_date: Optional[str] = None
     completed_date: Optional[str] = None
     comments: Optional[str] = None
-    attachments: List[str] = None
-    
-    def __post_init__(self):
-        if self.attachments is None:
-            self.attachments = []
+    attachments: List[str] = []
 
-@dataclass
-class WorkflowInstance:
+class WorkflowInstance(msgspec.Struct):
     """Workflow instance for a specific process"""
     workflow_id: str
     workflow_type: WorkflowType
@@ -68,83 +62,208 @@ class WorkflowInstance:
     initiated_date: str
     completed_date: Optional[str] = None
     current_step: Optional[str] = None
-    steps: List[WorkflowStep] = None
-    metadata: Dict[str, Any] = None
-    notes: List[Dict[str, str]] = None
-    
-    def __post_init__(self):
-        if self.steps is None:
-            self.steps = []
-        if self.metadata is None:
-            self.metadata = {}
-        if self.notes is None:
-            self.notes = []
+    steps: List[WorkflowStep] = []
+    metadata: Dict[str, Any] = {}
+    notes: List[Dict[str, str]] = []
 
 class WorkflowManager:
     """Manages workflows, approvals, and audit trails"""
     
     def __init__(self):
+        self.workflows_db = Path("app/data/workflows.db")
+        self.workflows_db.parent.mkdir(parents=True, exist_ok=True)
+        # Legacy JSON store, imported once when the database is first created
         self.workflows_file = Path("app/data/workflows.json")
-        self.workflows_file.parent.mkdir(parents=True, exist_ok=True)
-        self.workflows = self._load_workflows()
+        
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._init_schema()
         
         # Define workflow templates
         self.workflow_templates = self._define_workflow_templates()
     
-    def _load_workflows(self) -> List[WorkflowInstance]:
-        """Load workflows from file"""
-        if not self.workflows_file.exists():
-            return []
-        
+    def _connect(self) -> sqlite3.Connection:
+        """Open the workflow database in autocommit WAL mode"""
+        is_new = not self.workflows_db.exists()
+        conn = sqlite3.connect(str(self.workflows_db), isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._is_new_db = is_new
+        return conn
+    
+    def _init_schema(self):
+        """Create tables and indices, migrating the legacy JSON file if present"""
+        with self._lock:
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS workflows (
+                    workflow_id TEXT PRIMARY KEY,
+                    workflow_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    entity_id TEXT NOT NULL,
+                    entity_type TEXT NOT NULL,
+                    initiated_by TEXT NOT NULL,
+                    initiated_date TEXT NOT NULL,
+                    completed_date TEXT,
+                    current_step TEXT,
+                    metadata_json TEXT NOT NULL DEFAULT '{}'
+                );
+                CREATE TABLE IF NOT EXISTS steps (
+                    step_id TEXT PRIMARY KEY,
+                    workflow_id TEXT NOT NULL REFERENCES workflows(workflow_id),
+                    seq INTEGER NOT NULL,
+                    step_name TEXT NOT NULL,
+                    required_role TEXT NOT NULL,
+                    approval_level TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    assigned_to TEXT,
+                    started_date TEXT,
+                    completed_date TEXT,
+                    comments TEXT,
+                    attachments_json TEXT NOT NULL DEFAULT '[]'
+                );
+                CREATE TABLE IF NOT EXISTS notes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    workflow_id TEXT NOT NULL REFERENCES workflows(workflow_id),
+                    ts TEXT NOT NULL,
+                    user TEXT,
+                    note TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_workflows_entity ON workflows(entity_id, entity_type);
+                CREATE INDEX IF NOT EXISTS idx_workflows_status_step ON workflows(status, current_step);
+                CREATE INDEX IF NOT EXISTS idx_steps_workflow ON steps(workflow_id, seq);
+                CREATE INDEX IF NOT EXISTS idx_steps_active_role ON steps(required_role) WHERE status = 'IN_PROGRESS';
+                CREATE INDEX IF NOT EXISTS idx_notes_workflow ON notes(workflow_id, id);
+            """)
+        
+        if self._is_new_db and self.workflows_file.exists():
+            for workflow in self._load_legacy_workflows():
+                self._save_workflow(workflow)
+    
+    def _load_legacy_workflows(self) -> List[WorkflowInstance]:
+        """Load workflows from the legacy JSON file"""
         try:
-            with open(self.workflows_file, 'r') as f:
-                data = json.load(f)
-                workflows = []
-                for item in data:
-                    # Convert enum values back to enum objects
-                    item['workflow_type'] = WorkflowType(item['workflow_type'])
-                    item['status'] = WorkflowStatus(item['status'])
-                    
-                    # Convert steps
-                    steps = []
-                    for step_data in item.get('steps', []):
-                        step_data['approval_level'] = ApprovalLevel(step_data['approval_level'])
-                        step_data['status'] = WorkflowStatus(step_data['status'])
-                        steps.append(WorkflowStep(**step_data))
-                    item['steps'] = steps
-                    
-                    workflows.append(WorkflowInstance(**item))
-                return workflows
+            # msgspec validates the records and reconstructs enums while decoding
+            return msgspec.json.decode(self.workflows_file.read_bytes(), type=List[WorkflowInstance])
         except Exception as e:
             print(f"Error loading workflows: {e}")
             return []
     
-    def _save_workflows(self):
-        """Save workflows to file"""
-        try:
-            # Convert workflows to dictionaries
-            data = []
-            for workflow in self.workflows:
-                workflow_dict = asdict(workflow)
-                # Convert enums to string values
-                workflow_dict['workflow_type'] = workflow.workflow_type.value
-                workflow_dict['status'] = workflow.status.value
-                
-                # Convert steps
-                steps_data = []
-                for step in workflow.steps:
-                    step_dict = asdict(step)
-                    step_dict['approval_level'] = step.approval_level.value
-                    step_dict['status'] = step.status.value
-                    steps_data.append(step_dict)
-                workflow_dict['steps'] = steps_data
-                
-                data.append(workflow_dict)
+    @property
+    def workflows(self) -> List[WorkflowInstance]:
+        """All workflows, in initiation order"""
+        return self._query_workflows("SELECT * FROM workflows ORDER BY initiated_date, workflow_id")
+    
+    def _query_workflows(self, sql: str, params: tuple = ()) -> List[WorkflowInstance]:
+        """Run a query over the workflows table and hydrate full instances"""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            if not rows:
+                return []
             
-            with open(self.workflows_file, 'w') as f:
-                safe_json_dump(data, f, indent=2)
+            ids = [row["workflow_id"] for row in rows]
+            placeholders = ",".join("?" * len(ids))
+            steps_by_workflow: Dict[str, List[WorkflowStep]] = {wid: [] for wid in ids}
+            for step_row in self._conn.execute(
+                f"SELECT * FROM steps WHERE workflow_id IN ({placeholders}) ORDER BY workflow_id, seq", ids
+            ):
+                steps_by_workflow[step_row["workflow_id"]].append(self._row_to_step(step_row))
+            
+            notes_by_workflow: Dict[str, List[Dict[str, str]]] = {wid: [] for wid in ids}
+            for note_row in self._conn.execute(
+                f"SELECT * FROM notes WHERE workflow_id IN ({placeholders}) ORDER BY id", ids
+            ):
+                notes_by_workflow[note_row["workflow_id"]].append({
+                    "timestamp": note_row["ts"],
+                    "user": note_row["user"],
+                    "note": note_row["note"]
+                })
+        
+        return [
+            WorkflowInstance(
+                workflow_id=row["workflow_id"],
+                workflow_type=WorkflowType(row["workflow_type"]),
+                entity_id=row["entity_id"],
+                entity_type=row["entity_type"],
+                status=WorkflowStatus(row["status"]),
+                initiated_by=row["initiated_by"],
+                initiated_date=row["initiated_date"],
+                completed_date=row["completed_date"],
+                current_step=row["current_step"],
+                steps=steps_by_workflow[row["workflow_id"]],
+                metadata=msgspec.json.decode(row["metadata_json"]),
+                notes=notes_by_workflow[row["workflow_id"]]
+            )
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _row_to_step(row: sqlite3.Row) -> WorkflowStep:
+        """Convert a steps row to a WorkflowStep"""
+        return WorkflowStep(
+            step_id=row["step_id"],
+            step_name=row["step_name"],
+            required_role=row["required_role"],
+            approval_level=ApprovalLevel(row["approval_level"]),
+            status=WorkflowStatus(row["status"]),
+            assigned_to=row["assigned_to"],
+            started_date=row["started_date"],
+            completed_date=row["completed_date"],
+            comments=row["comments"],
+            attachments=msgspec.json.decode(row["attachments_json"], type=List[str])
+        )
+    
+    def _save_workflow(self, workflow: WorkflowInstance):
+        """Persist a single workflow, its steps and any notes not yet stored"""
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.execute(
+                        """INSERT OR REPLACE INTO workflows (
+                               workflow_id, workflow_type, status, entity_id, entity_type,
+                               initiated_by, initiated_date, completed_date, current_step, metadata_json
+                           ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (
+                            workflow.workflow_id, workflow.workflow_type.value, workflow.status.value,
+                            workflow.entity_id, workflow.entity_type, workflow.initiated_by,
+                            workflow.initiated_date, workflow.completed_date, workflow.current_step,
+                            msgspec.json.encode(workflow.metadata).decode()
+                        )
+                    )
+                    self._conn.executemany(
+                        """INSERT OR REPLACE INTO steps (
+                               step_id, workflow_id, seq, step_name, required_role, approval_level,
+                               status, assigned_to, started_date, completed_date, comments, attachments_json
+                           ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        [
+                            (
+                                step.step_id, workflow.workflow_id, seq, step.step_name, step.required_role,
+                                step.approval_level.value, step.status.value, step.assigned_to,
+                                step.started_date, step.completed_date, step.comments,
+                                msgspec.json.encode(step.attachments).decode()
+                            )
+                            for seq, step in enumerate(workflow.steps)
+                        ]
+                    )
+                    
+                    # Notes are an append-only audit trail
+                    stored_notes = self._conn.execute(
+                        "SELECT COUNT(*) FROM notes WHERE workflow_id = ?", (workflow.workflow_id,)
+                    ).fetchone()[0]
+                    self._conn.executemany(
+                        "INSERT INTO notes (workflow_id, ts, user, note) VALUES (?, ?, ?, ?)",
+                        [
+                            (workflow.workflow_id, note.get("timestamp"), note.get("user"), note.get("note"))
+                            for note in workflow.notes[stored_notes:]
+                        ]
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
         except Exception as e:
-            print(f"Error saving workflows: {e}")
+            print(f"Error saving workflow {workflow.workflow_id}: {e}")
     
     def _define_workflow_templates(self) -> Dict[WorkflowType, List[Dict]]:
         """Define workflow templates for different types"""
@@ -221,7 +340,10 @@ class WorkflowManager:
         """Generate unique workflow ID"""
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         type_prefix = workflow_type.value[:3].upper()
-        count = len([w for w in self.workflows if w.workflow_id.startswith(f"{type_prefix}-{timestamp}")])
+        with self._lock:
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM workflows WHERE workflow_id LIKE ?", (f"{type_prefix}-{timestamp}%",)
+            ).fetchone()[0]
         return f"{type_prefix}-{timestamp}-{count:03d}"
     
     def initiate_workflow(self, workflow_type: WorkflowType, entity_id: str, 
@@ -262,36 +384,36 @@ class WorkflowManager:
             steps[0].status = WorkflowStatus.IN_PROGRESS
             steps[0].started_date = datetime.now().isoformat()
         
-        self.workflows.append(workflow)
-        self._save_workflows()
+        self._save_workflow(workflow)
         
         return workflow
     
     def get_workflow(self, workflow_id: str) -> Optional[WorkflowInstance]:
         """Get workflow by ID"""
-        for workflow in self.workflows:
-            if workflow.workflow_id == workflow_id:
-                return workflow
-        return None
+        workflows = self._query_workflows("SELECT * FROM workflows WHERE workflow_id = ?", (workflow_id,))
+        return workflows[0] if workflows else None
     
     def get_workflows_by_entity(self, entity_id: str, entity_type: str = None) -> List[WorkflowInstance]:
         """Get workflows by entity"""
-        workflows = []
-        for workflow in self.workflows:
-            if workflow.entity_id == entity_id:
-                if entity_type is None or workflow.entity_type == entity_type:
-                    workflows.append(workflow)
-        return workflows
+        if entity_type is None:
+            return self._query_workflows(
+                "SELECT * FROM workflows WHERE entity_id = ? ORDER BY initiated_date, workflow_id", (entity_id,)
+            )
+        return self._query_workflows(
+            "SELECT * FROM workflows WHERE entity_id = ? AND entity_type = ? ORDER BY initiated_date, workflow_id",
+            (entity_id, entity_type)
+        )
     
     def get_pending_workflows(self, user_role: str) -> List[WorkflowInstance]:
         """Get workflows pending action by user role"""
-        pending = []
-        for workflow in self.workflows:
-            if workflow.status in [WorkflowStatus.IN_PROGRESS, WorkflowStatus.PENDING_APPROVAL]:
-                current_step = next((step for step in workflow.steps if step.step_id == workflow.current_step), None)
-                if current_step and current_step.required_role == user_role and current_step.status == WorkflowStatus.IN_PROGRESS:
-                    pending.append(workflow)
-        return pending
+        return self._query_workflows(
+            """SELECT w.* FROM steps s
+               JOIN workflows w ON w.current_step = s.step_id
+               WHERE s.status = 'IN_PROGRESS' AND s.required_role = ?
+                 AND w.status IN (?, ?)
+               ORDER BY w.initiated_date, w.workflow_id""",
+            (user_role, WorkflowStatus.IN_PROGRESS.value, WorkflowStatus.PENDING_APPROVAL.value)
+        )
     
     def approve_step(self, workflow_id: str, step_id: str, approved_by: str, 
                     comments: str = None, attachments: List[str] = None) -> bool:
@@ -350,7 +472,7 @@ class WorkflowManager:
             "note": f"Step '{step.step_name}' rejected by {rejected_by}: {reason}"
         })
         
-        self._save_workflows()
+        self._save_workflow(workflow)
         return True
     
     def assign_step(self, workflow_id: str, step_id: str, assigned_to: str, assigned_by: str) -> bool:
@@ -373,7 +495,7 @@ class WorkflowManager:
             "note": f"Step '{step.step_name}' assigned to {assigned_to}"
         })
         
-        self._save_workflows()
+        self._save_workflow(workflow)
         return True
     
     def _advance_workflow(self, workflow: WorkflowInstance, updated_by: str):
@@ -409,7 +531,7 @@ class WorkflowManager:
                 "note": "Workflow completed successfully"
             })
         
-        self._save_workflows()
+        self._save_workflow(workflow)
     
     def cancel_workflow(self, workflow_id: str, cancelled_by: str, reason: str) -> bool:
         """Cancel a workflow"""
@@ -427,12 +549,23 @@ class WorkflowManager:
             "note": f"Workflow cancelled: {reason}"
         })
         
-        self._save_workflows()
+        self._save_workflow(workflow)
         return True
     
     def get_workflow_statistics(self) -> Dict[str, Any]:
         """Get workflow statistics"""
-        total = len(self.workflows)
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM workflows").fetchone()[0]
+            status_rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM workflows GROUP BY status"
+            ).fetchall()
+            type_rows = self._conn.execute(
+                "SELECT workflow_type, COUNT(*) FROM workflows GROUP BY workflow_type"
+            ).fetchall()
+            avg_completion_time = self._conn.execute(
+                """SELECT AVG((julianday(completed_date) - julianday(initiated_date)) * 24)
+                   FROM workflows WHERE completed_date IS NOT NULL"""
+            ).fetchone()[0] or 0
         
         if total == 0:
             return {
@@ -445,27 +578,12 @@ class WorkflowManager:
             }
         
         # Count by status
-        status_counts = {}
-        for status in WorkflowStatus:
-            status_counts[status.value] = len([w for w in self.workflows if w.status == status])
+        status_counts = {status.value: 0 for status in WorkflowStatus}
+        status_counts.update({row[0]: row[1] for row in status_rows})
         
         # Count by type
-        type_counts = {}
-        for workflow_type in WorkflowType:
-            type_counts[workflow_type.value] = len([w for w in self.workflows if w.workflow_type == workflow_type])
-        
-        # Calculate average completion time
-        completed_workflows = [w for w in self.workflows if w.completed_date]
-        if completed_workflows:
-            total_hours = 0
-            for workflow in completed_workflows:
-                start_date = datetime.fromisoformat(workflow.initiated_date)
-                end_date = datetime.fromisoformat(workflow.completed_date)
-                hours = (end_date - start_date).total_seconds() / 3600
-                total_hours += hours
-            avg_completion_time = total_hours / len(completed_workflows)
-        else:
-            avg_completion_time = 0
+        type_counts = {workflow_type.value: 0 for workflow_type in WorkflowType}
+        type_counts.update({row[0]: row[1] for row in type_rows})
         
         return {
             "total_workflows": total,
@@ -1,227 +1,275 @@
+import os
+import difflib
+import functools
 import streamlit as st
 import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from core.auth import require_admin, get_current_user
 from core.erp_manager import (
     erp_manager, ProductStatus, ProductCategory, ProductData
 )
-from core.workflow_manager import workflow_manager, WorkflowType
-from core.label_generator import label_generator, LabelFormat
 from core.audit_logger import log_user_action
-from core.json_utils import safe_json_dumps
+from core.json_utils import safe_json_bytes, safe_json_stream
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 st.set_page_config(page_title="ERP Product Management - Legal Metrology Checker", page_icon="📦", layout="wide")
 
 # Enhanced Custom CSS for ERP Management
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    .main {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* ERP Header */
-    .erp-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 30px rgba(102, 126, 234, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .erp-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="boxes" width="20" height="20" patternUnits="userSpaceOnUse"><rect width="18" height="18" fill="white" opacity="0.1"/></pattern></defs><rect width="100" height="100" fill="url(%23boxes)"/></svg>');
-        opacity: 0.1;
-    }
-    
-    .erp-header h1 {
-        font-size: 3rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    /* ERP Form Cards */
-    .erp-form-card {
-        background: white;
-        padding: 2.5rem;
-        border-radius: 20px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .erp-form-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 15px 40px rgba(0,0,0,0.15);
-    }
-    
-    .erp-form-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Product Status Cards */
-    .product-status-card {
-        background: rgba(255, 255, 255, 0.95);
-        backdrop-filter: blur(10px);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: all 0.3s ease;
-    }
-    
-    .product-status-card.draft {
-        border-left: 4px solid #ff9800;
-        background: linear-gradient(135deg, rgba(255, 152, 0, 0.1) 0%, rgba(255, 152, 0, 0.05) 100%);
-    }
-    
-    .product-status-card.compliant {
-        border-left: 4px solid #4CAF50;
-        background: linear-gradient(135deg, rgba(76, 175, 80, 0.1) 0%, rgba(76, 175, 80, 0.05) 100%);
-    }
-    
-    .product-status-card.non-compliant {
-        border-left: 4px solid #f44336;
-        background: linear-gradient(135deg, rgba(244, 67, 54, 0.1) 0%, rgba(244, 67, 54, 0.05) 100%);
-    }
-    
-    .product-status-card.pending {
-        border-left: 4px solid #2196F3;
-        background: linear-gradient(135deg, rgba(33, 150, 243, 0.1) 0%, rgba(33, 150, 243, 0.05) 100%);
-    }
-    
-    /* ERP Tab Styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: white;
-        border-radius: 10px 10px 0 0;
-        padding: 1rem 2rem;
-        border: 1px solid #e0e0e0;
-        font-weight: 600;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-    }
-    
-    /* Enhanced Input Styling */
-    .stTextInput > div > div > input,
-    .stNumberInput > div > div > input,
-    .stSelectbox > div > div > select,
-    .stTextArea > div > div > textarea {
-        border-radius: 10px !important;
-        border: 2px solid #e0e0e0 !important;
-        transition: border-color 0.3s ease !important;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stNumberInput > div > div > input:focus,
-    .stSelectbox > div > div > select:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1) !important;
-    }
-    
-    /* Product Grid */
-    .product-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    .product-card {
-        background: white;
-        border-radius: 15px;
-        padding: 1.5rem;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .product-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-        border-color: #667eea;
-    }
-    
-    .product-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Metrics Cards */
-    .erp-metric-card {
-        background: white;
-        padding: 2rem;
-        border-radius: 20px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        position: relative;
-        overflow: hidden;
-        text-align: center;
-    }
-    
-    .erp-metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 15px 40px rgba(0,0,0,0.15);
-    }
-    
-    .erp-metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Alert Enhancements */
-    .stAlert {
-        border-radius: 15px !important;
-        border: none !important;
+_FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+"""
+
+@st.cache_data
+def _erp_css() -> str:
+    return f"{_FONT_LINKS}<style>\n{Path('app/static/erp.css').read_text(encoding='utf-8')}</style>"
+
+st.markdown(_erp_css(), unsafe_allow_html=True)
+
+PRODUCTS_PER_PAGE = 50
+# Catalogues smaller than this skip the similarity pass and rely on the exact check
+SIMILARITY_MIN_PRODUCTS = int(os.getenv("ERP_SIMILARITY_MIN_PRODUCTS", "20"))
+_PRODUCT_DETAILS_TEMPLATE = "\n\n".join([
+    "**Product Name:** {product.product_name}",
+    "**Manufacturer:** {product.manufacturer_name}",
+    "**MRP:** ₹{product.mrp}",
+    "**Net Quantity:** {product.net_quantity} {product.unit}",
+    "**Category:** {category}",
+    "**Status:** {status}",
+    "**Created:** {created}",
+])
+_LABEL_DETAILS_TEMPLATE = "  \n".join([
+    "**Product SKU:** {label.product_sku}",
+    "**Format:** {label_format}",
+    "**Status:** {status}",
+    "**Created By:** {label.created_by}",
+    "**Created Date:** {created}",
+    "**Compliance Gate:** {gate}",
+])
+_STATUS_VALUES = tuple(status.value for status in ProductStatus)
+_STATUS_INDEX = {status: i for i, status in enumerate(ProductStatus)}
+_CATEGORY_VALUES = tuple(category.value for category in ProductCategory)
+_STATUS_FILTER_OPTIONS = ("All",) + _STATUS_VALUES
+_CATEGORY_FILTER_OPTIONS = ("All",) + _CATEGORY_VALUES
+_UNIT_OPTIONS = ("g", "kg", "ml", "l", "L", "pcs", "piece", "pack", "gm", "mg")
+
+# Export columns; enum fields are serialized to their values by safe_json_bytes
+PRODUCT_EXPORT_FIELDS = (
+    "sku", "product_name", "mrp", "net_quantity", "unit", "manufacturer_name",
+    "category", "status", "compliance_status", "created_date", "tags"
+)
+WORKFLOW_EXPORT_FIELDS = (
+    "workflow_id", "workflow_type", "entity_id", "status",
+    "initiated_by", "initiated_date", "completed_date"
+)
+STEP_EXPORT_FIELDS = ("step_name", "required_role", "status", "completed_date")
+_product_export_getter = attrgetter(*PRODUCT_EXPORT_FIELDS)
+_workflow_export_getter = attrgetter(*WORKFLOW_EXPORT_FIELDS)
+_step_export_getter = attrgetter(*STEP_EXPORT_FIELDS)
+
+@functools.lru_cache(maxsize=256)
+def _pretty(value: str) -> str:
+    """Display form of an enum value, e.g. UNDER_REVIEW -> Under Review"""
+    return value.replace("_", " ").title()
+
+def _products_version() -> int:
+    """Change token for the product file, written by every ERP mutation in any session"""
+    products_file = erp_manager.products_file
+    return products_file.stat().st_mtime_ns if products_file.exists() else 0
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _load_all_products(version):
+    """Product list shared by every tab, built once per product file version"""
+    return erp_manager.get_all_products()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _load_products_df(version):
+    """Columnar view of the product list used for duplicate and similarity checks"""
+    products = _load_all_products(version)
+    return pd.DataFrame({
+        "sku": [p.sku for p in products],
+        "product_name": [p.product_name for p in products],
+        "manufacturer_name": [p.manufacturer_name for p in products],
+        "unit": [p.unit for p in products],
+        "created_date": [p.created_date for p in products],
+        "name_lower": [p.product_name.lower() for p in products],
+        "mfr_lower": [p.manufacturer_name.lower() for p in products],
+        "unit_lower": [p.unit.lower() for p in products],
+        "tags_lower": ["\n".join(p.tags).lower() for p in products],
+        "mrp": np.array([p.mrp for p in products], dtype=float),
+        "net_quantity": np.array([p.net_quantity for p in products], dtype=float),
+        "status": [p.status.value for p in products],
+        "category": [p.category.value for p in products],
+        "compliance_status": [p.compliance_status for p in products],
+    })
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _load_exact_index(version):
+    """Row positions keyed by (name, manufacturer, unit), lowercased, for O(1) duplicate lookups"""
+    return _load_products_df(version).groupby(["name_lower", "mfr_lower", "unit_lower"]).indices
+
+@st.cache_data(show_spinner=False)
+def _compute_stats(df):
+    """Product statistics from a single value_counts pass per column"""
+    by_status = df["status"].value_counts().reindex(
+        _STATUS_VALUES, fill_value=0
+    ).rename_axis("Status").rename("Count")
+    by_category = df["category"].value_counts().reindex(
+        _CATEGORY_VALUES, fill_value=0
+    ).rename_axis("Category").rename("Count")
+    compliance = df["compliance_status"]
+    by_compliance = compliance.where(compliance.isin(["COMPLIANT", "NON_COMPLIANT"]), "PENDING").value_counts().reindex(
+        ["COMPLIANT", "NON_COMPLIANT", "PENDING"], fill_value=0
+    )
+    return {
+        "total_products": len(df),
+        "by_status": by_status,
+        "by_category": by_category,
+        "by_compliance": by_compliance,
+        "draft_products": int(by_status["DRAFT"]),
+        "approved_products": int(by_status["APPROVED"]),
+        "dispatched_products": int(by_status["DISPATCHED"]),
+        "blocked_products": int(by_status["BLOCKED"])
     }
-</style>
-""", unsafe_allow_html=True)
+
+def _products():
+    """Session copy of the product list, reloaded from the cache only when the product file changes"""
+    version = _products_version()
+    if st.session_state.get("erp_products_version") != version:
+        st.session_state.erp_products = _load_all_products(version)
+        st.session_state.erp_products_df = _load_products_df(version)
+        st.session_state.erp_exact_index = _load_exact_index(version)
+        st.session_state.erp_products_version = version
+    return st.session_state.erp_products
+
+def _products_df():
+    """Session copy of the products DataFrame, kept in step with _products()"""
+    _products()
+    return st.session_state.erp_products_df
+
+def _exact_index():
+    """Session copy of the duplicate-lookup index, kept in step with _products()"""
+    _products()
+    return st.session_state.erp_exact_index
+
+def _refresh_products():
+    """Drop the cached product views after a mutation"""
+    _load_all_products.clear()
+    _load_products_df.clear()
+    _load_exact_index.clear()
+    st.session_state.pop("erp_products", None)
+    st.session_state.pop("erp_products_df", None)
+    st.session_state.pop("erp_exact_index", None)
+    st.session_state.pop("erp_products_version", None)
+
+def _similarity_ratios(query, choices):
+    """Similarity ratio (0-1) of query against every choice"""
+    if RAPIDFUZZ_AVAILABLE:
+        return process.cdist([query], choices, scorer=fuzz.ratio)[0] / 100.0
+    return np.fromiter(
+        (difflib.SequenceMatcher(None, query, choice).ratio() for choice in choices),
+        dtype=float, count=len(choices)
+    )
+
+def _workflow_rows(workflows):
+    """Yield workflow export rows one at a time for safe_json_stream"""
+    for workflow in workflows:
+        row = dict(zip(WORKFLOW_EXPORT_FIELDS, _workflow_export_getter(workflow)))
+        row["steps"] = [dict(zip(STEP_EXPORT_FIELDS, _step_export_getter(step))) for step in workflow.steps]
+        yield row
+
+def _download(label, filename_prefix, exported_by, rows_key=None, rows=(), **fields):
+    """Stamp an export, encode it once and render its download button
+    
+    With ``rows_key`` the rows are streamed into that array field after the
+    header fields; otherwise the header fields alone make up the document.
+    """
+    now = datetime.now()
+    header = {"export_timestamp": now.isoformat(), "exported_by": exported_by, **fields}
+    data = safe_json_stream(header, rows_key, rows) if rows_key else safe_json_bytes(header)
+    st.download_button(
+        label=label,
+        data=data,
+        file_name=f"{filename_prefix}_{now.strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _preview(label_id, version):
+    """Rendered label PNG; version bumps on approve/reject so stale previews are never served"""
+    from core.label_generator import label_generator
+    return label_generator.generate_label_image(label_id)
+
+@st.cache_data(show_spinner=False)
+def _labels_df(version):
+    """Label summary table, rebuilt whenever labels.json changes"""
+    from core.label_generator import label_generator
+    labels = label_generator.labels
+    return pd.DataFrame({
+        "Label ID": [label.label_id for label in labels],
+        "Product SKU": [label.product_sku for label in labels],
+        "Format": [label.label_format.value for label in labels],
+        "Status": [label.status.value for label in labels],
+        "Compliance Gate": [label.compliance_gate_status.value for label in labels],
+        "Created By": [label.created_by for label in labels],
+        "Created": [label.created_date[:10] for label in labels],
+    })
+
+@st.cache_data(show_spinner=False)
+def _series(items):
+    """Count Series for a chart, reused while the (key, count) pairs are unchanged"""
+    return pd.Series(dict(items), name="Count")
+
+def _file_version(*paths):
+    """Cheap change token for cached reads: modification times of the backing files"""
+    return tuple(path.stat().st_mtime_ns if path.exists() else 0 for path in paths)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _workflow_stats(version):
+    from core.workflow_manager import workflow_manager
+    return workflow_manager.get_workflow_statistics()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _label_stats(version):
+    from core.label_generator import label_generator
+    return label_generator.get_label_statistics()
+
+def _workflow_version(workflow_manager):
+    db = workflow_manager.workflows_db
+    return _file_version(db, db.with_name(db.name + "-wal"))
+
+@st.cache_resource
+def _similarity_executor():
+    return ThreadPoolExecutor(max_workers=2)
+
+@st.cache_resource
+def _log_executor():
+    # One worker keeps audit log appends serialized, so no file lock is needed
+    return ThreadPoolExecutor(max_workers=1)
+
+def _find_similar_products(name_lower, mfr_lower, df):
+    """Return (row, score) pairs for products whose name and manufacturer are close, best first"""
+    if df.empty:
+        return []
+    name_scores = _similarity_ratios(name_lower, df["name_lower"].tolist())
+    mfr_scores = _similarity_ratios(mfr_lower, df["mfr_lower"].tolist())
+    
+    # Consider it similar if name similarity > 80% and manufacturer similarity > 70%
+    scores = (name_scores * 0.6 + mfr_scores * 0.4) * 100
+    rows = np.where((name_scores > 0.8) & (mfr_scores > 0.7))[0]
+    rows = rows[np.argsort(-scores[rows], kind="stable")]
+    return [(int(row), float(scores[row])) for row in rows]
 
 # Require admin access
 require_admin()
@@ -235,16 +283,8 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# Create tabs for different ERP functions
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "📝 Product Data Entry", 
-    "📊 Product Dashboard", 
-    "🔄 Workflow Management", 
-    "🏷️ Label Generation",
-    "📈 Analytics & Reports"
-])
-
-with tab1:
+@st.fragment
+def _product_entry_tab():
     st.markdown("### 📝 ERP Product Data Entry")
     st.markdown("Enter new product data for Legal Metrology compliance processing.")
     
@@ -280,7 +320,7 @@ with tab1:
             
             unit = st.selectbox(
                 "Unit *",
-                options=["g", "kg", "ml", "l", "L", "pcs", "piece", "pack", "gm", "mg"],
+                options=_UNIT_OPTIONS,
                 help="Unit of measurement"
             )
             
@@ -293,8 +333,8 @@ with tab1:
         with col2:
             category = st.selectbox(
                 "Product Category *",
-                options=[cat.value for cat in ProductCategory],
-                format_func=lambda x: x.replace("_", " ").title(),
+                options=_CATEGORY_VALUES,
+                format_func=_pretty,
                 help="Select the product category"
             )
             
@@ -346,28 +386,26 @@ with tab1:
             if not all([product_name, mrp, net_quantity, unit, manufacturer_name]):
                 st.error("Please fill in all required fields (marked with *).")
             else:
-                # Check for existing products before adding
-                search_product = {
-                    'product_name': product_name,
-                    'manufacturer_name': manufacturer_name,
-                    'mrp': mrp,
-                    'net_quantity': net_quantity,
-                    'unit': unit,
-                    'category': category
-                }
-                
-                # Check for exact match
-                exact_match = None
-                for existing_product in erp_manager.get_all_products():
-                    if (product_name.lower() == existing_product.product_name.lower() and
-                        manufacturer_name.lower() == existing_product.manufacturer_name.lower() and
-                        abs(float(mrp) - float(existing_product.mrp)) < 0.01 and
-                        abs(float(net_quantity) - float(existing_product.net_quantity)) < 0.01 and
-                        unit.lower() == existing_product.unit.lower()):
-                        exact_match = existing_product
-                        break
+                # Check for existing products before adding: an exact match here,
+                # while the similarity pass runs in the background
+                all_products = _products()
+                name_lower = product_name.lower()
+                mfr_lower = manufacturer_name.lower()
+                similarity_future = None
+                if len(all_products) >= SIMILARITY_MIN_PRODUCTS:
+                    similarity_future = _similarity_executor().submit(
+                        _find_similar_products, name_lower, mfr_lower, _products_df()
+                    )
+                exact_match = next((
+                    all_products[row]
+                    for row in _exact_index().get((name_lower, mfr_lower, unit.lower()), ())
+                    if abs(float(mrp) - float(all_products[row].mrp)) < 0.01 and
+                    abs(float(net_quantity) - float(all_products[row].net_quantity)) < 0.01
+                ), None)
                 
                 if exact_match:
+                    if similarity_future:
+                        similarity_future.cancel()
                     st.error(f"⚠️ **Duplicate Product Detected!**")
                     st.warning(f"A product with identical details already exists:")
                     st.info(f"**Existing Product:**")
@@ -378,20 +416,12 @@ with tab1:
                 else:
                     # Check for similar products
                     similar_products = []
-                    for existing_product in erp_manager.get_all_products():
-                        # Calculate similarity based on name and manufacturer
-                        import difflib
-                        name_similarity = difflib.SequenceMatcher(
-                            None, product_name.lower(), existing_product.product_name.lower()
-                        ).ratio()
-                        manufacturer_similarity = difflib.SequenceMatcher(
-                            None, manufacturer_name.lower(), existing_product.manufacturer_name.lower()
-                        ).ratio()
-                        
-                        # Consider it similar if name similarity > 80% and manufacturer similarity > 70%
-                        if name_similarity > 0.8 and manufacturer_similarity > 0.7:
-                            similarity_score = (name_similarity * 0.6 + manufacturer_similarity * 0.4) * 100
-                            similar_products.append((existing_product, similarity_score))
+                    if similarity_future:
+                        with st.spinner("Checking for similar products..."):
+                            similar_products = [
+                                (all_products[row], score)
+                                for row, score in similarity_future.result()
+                            ]
                     
                     if similar_products:
                         st.warning(f"⚠️ **Similar Products Found!**")
@@ -436,11 +466,12 @@ with tab1:
                                 country_of_origin=country_of_origin if country_of_origin else None,
                                 tags=tag_list
                             )
+                            _refresh_products()
                             
                             st.success(f"✅ Product added successfully!")
                             st.info(f"**SKU:** {product.sku}")
                             st.info(f"**Status:** {product.status.value}")
-                            st.info(f"**Category:** {product.category.value.replace('_', ' ').title()}")
+                            st.info(f"**Category:** {_pretty(product.category.value)}")
                             
                             # Log the action
                             log_user_action(
@@ -467,11 +498,16 @@ with tab1:
     </div>
     """, unsafe_allow_html=True)
 
-with tab2:
+@st.fragment
+def _product_dashboard_tab():
     st.markdown("### 📊 Product Dashboard")
     
     # Get product statistics
-    stats = erp_manager.get_product_statistics()
+    stats = _compute_stats(_products_df())
+    
+    if stats["total_products"] == 0:
+        st.info("No products found. Add one from the 📝 Product Data Entry tab.")
+        return
     
     # Enhanced Overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -513,19 +549,11 @@ with tab2:
     
     with col1:
         st.subheader("📈 Status Distribution")
-        if stats["by_status"]:
-            status_df = pd.DataFrame(list(stats["by_status"].items()), columns=["Status", "Count"])
-            st.bar_chart(status_df.set_index("Status"))
-        else:
-            st.info("No products found.")
+        st.bar_chart(stats["by_status"])
     
     with col2:
         st.subheader("📂 Category Distribution")
-        if stats["by_category"]:
-            category_df = pd.DataFrame(list(stats["by_category"].items()), columns=["Category", "Count"])
-            st.bar_chart(category_df.set_index("Category"))
-        else:
-            st.info("No products found.")
+        st.bar_chart(stats["by_category"])
     
     # Product search and management
     st.subheader("🔍 Product Management")
@@ -539,122 +567,172 @@ with tab2:
     with col2:
         status_filter = st.selectbox(
             "Filter by Status",
-            options=["All"] + [status.value for status in ProductStatus],
-            format_func=lambda x: x.replace("_", " ").title()
+            options=_STATUS_FILTER_OPTIONS,
+            format_func=_pretty
         )
     
     with col3:
         category_filter = st.selectbox(
             "Filter by Category",
-            options=["All"] + [category.value for category in ProductCategory],
-            format_func=lambda x: x.replace("_", " ").title()
+            options=_CATEGORY_FILTER_OPTIONS,
+            format_func=_pretty
         )
     
     # Get filtered products
-    all_products = erp_manager.get_all_products()
+    products_df = _products_df()
+    mask = pd.Series(True, index=products_df.index)
     
     if search_query:
-        all_products = erp_manager.search_products(search_query)
+        query = search_query.lower()
+        mask &= (
+            products_df["name_lower"].str.contains(query, regex=False) |
+            products_df["sku"].str.lower().str.contains(query, regex=False) |
+            products_df["mfr_lower"].str.contains(query, regex=False) |
+            products_df["tags_lower"].str.contains(query, regex=False)
+        )
     
     if status_filter != "All":
-        all_products = [p for p in all_products if p.status.value == status_filter]
+        mask &= products_df["status"] == status_filter
     
     if category_filter != "All":
-        all_products = [p for p in all_products if p.category.value == category_filter]
+        mask &= products_df["category"] == category_filter
+    
+    filtered_df = products_df.loc[mask]
     
     # Display products
-    if all_products:
-        st.markdown(f"**Found {len(all_products)} product(s)**")
+    if not filtered_df.empty:
+        st.markdown(f"**Found {len(filtered_df)} product(s)**")
         
-        for product in all_products:
-            with st.expander(f"{product.sku} - {product.product_name}"):
-                col1, col2 = st.columns([2, 1])
+        page_count = -(-len(filtered_df) // PRODUCTS_PER_PAGE)
+        if st.session_state.get("products_page", 1) > page_count:
+            st.session_state.products_page = page_count
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="products_page")
+        page_df = filtered_df.iloc[(page - 1) * PRODUCTS_PER_PAGE:page * PRODUCTS_PER_PAGE]
+        
+        products_table = pd.DataFrame({
+            "SKU": page_df["sku"],
+            "Product Name": page_df["product_name"],
+            "Manufacturer": page_df["manufacturer_name"],
+            "MRP (₹)": page_df["mrp"],
+            "Net Quantity": page_df["net_quantity"].astype(str) + " " + page_df["unit"],
+            "Category": page_df["category"].map(_pretty),
+            "Status": page_df["status"].map(_pretty),
+            "Created": page_df["created_date"].str[:10],
+        })
+        event = st.dataframe(
+            products_table,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="products_table"
+        )
+        
+        selected_rows = [row for row in event.selection.rows if row < len(page_df)]
+        if not selected_rows:
+            st.caption("Select a product to update its status, start a workflow or generate a label.")
+        else:
+            product = _products()[page_df.index[selected_rows[0]]]
+            st.markdown(f"#### {product.sku} - {product.product_name}")
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                details = [_PRODUCT_DETAILS_TEMPLATE.format(
+                    product=product,
+                    category=_pretty(product.category.value),
+                    status=_pretty(product.status.value),
+                    created=product.created_date[:10]
+                )]
                 
-                with col1:
-                    st.markdown(f"**Product Name:** {product.product_name}")
-                    st.markdown(f"**Manufacturer:** {product.manufacturer_name}")
-                    st.markdown(f"**MRP:** ₹{product.mrp}")
-                    st.markdown(f"**Net Quantity:** {product.net_quantity} {product.unit}")
-                    st.markdown(f"**Category:** {product.category.value.replace('_', ' ').title()}")
-                    st.markdown(f"**Status:** {product.status.value.replace('_', ' ').title()}")
-                    st.markdown(f"**Created:** {product.created_date[:10]}")
-                    
-                    if product.compliance_status:
-                        st.markdown(f"**Compliance Status:** {product.compliance_status}")
-                    
-                    if product.compliance_issues:
-                        st.markdown(f"**Compliance Issues:** {', '.join(product.compliance_issues)}")
+                if product.compliance_status:
+                    details.append(f"**Compliance Status:** {product.compliance_status}")
                 
-                with col2:
-                    # Status update
-                    st.markdown("**Update Status:**")
-                    new_status = st.selectbox(
-                        "Status",
-                        options=[status.value for status in ProductStatus],
-                        index=list(ProductStatus).index(product.status),
-                        key=f"status_{product.sku}"
-                    )
-                    
-                    if st.button("Update Status", key=f"update_status_{product.sku}"):
-                        if erp_manager.update_product_status(
-                            product.sku, 
-                            ProductStatus(new_status), 
-                            current_user.username
-                        ):
-                            st.success("Status updated successfully!")
+                if product.compliance_issues:
+                    details.append(f"**Compliance Issues:** {', '.join(product.compliance_issues)}")
+                
+                st.markdown("\n\n".join(details))
+            
+            with col2:
+                # Status update
+                st.markdown("**Update Status:**")
+                new_status = st.selectbox(
+                    "Status",
+                    options=_STATUS_VALUES,
+                    index=_STATUS_INDEX[product.status],
+                    key=f"status_{product.sku}"
+                )
+                
+                if st.button("Update Status", key=f"update_status_{product.sku}"):
+                    if erp_manager.update_product_status(
+                        product.sku, 
+                        ProductStatus(new_status), 
+                        current_user.username
+                    ):
+                        _refresh_products()
+                        st.success("Status updated successfully!")
+                        st.rerun()
+                
+                # Workflow actions
+                if product.status == ProductStatus.DRAFT:
+                    if st.button("Start Approval Workflow", key=f"workflow_{product.sku}"):
+                        from core.workflow_manager import workflow_manager, WorkflowType
+                        try:
+                            workflow = workflow_manager.initiate_workflow(
+                                WorkflowType.PRODUCT_APPROVAL,
+                                product.sku,
+                                "PRODUCT",
+                                current_user.username,
+                                {"product_name": product.product_name}
+                            )
+                            _workflow_stats.clear()
+                            st.success(f"Workflow initiated: {workflow.workflow_id}")
                             st.rerun()
-                    
-                    # Workflow actions
-                    if product.status == ProductStatus.DRAFT:
-                        if st.button("Start Approval Workflow", key=f"workflow_{product.sku}"):
-                            try:
-                                workflow = workflow_manager.initiate_workflow(
-                                    WorkflowType.PRODUCT_APPROVAL,
-                                    product.sku,
-                                    "PRODUCT",
-                                    current_user.username,
-                                    {"product_name": product.product_name}
-                                )
-                                st.success(f"Workflow initiated: {workflow.workflow_id}")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error starting workflow: {str(e)}")
-                    
-                    # Label generation
-                    if product.status == ProductStatus.APPROVED:
-                        if st.button("Generate Label", key=f"label_{product.sku}"):
-                            try:
-                                product_data = {
-                                    "sku": product.sku,
-                                    "product_name": product.product_name,
-                                    "mrp": product.mrp,
-                                    "net_quantity": product.net_quantity,
-                                    "unit": product.unit,
-                                    "manufacturer_name": product.manufacturer_name,
-                                    "mfg_date": product.mfg_date,
-                                    "expiry_date": product.expiry_date,
-                                    "batch_number": product.batch_number,
-                                    "fssai_number": product.fssai_number,
-                                    "country_of_origin": product.country_of_origin
-                                }
-                                
-                                label = label_generator.create_label_from_product(
-                                    product_data,
-                                    LabelFormat.STANDARD,
-                                    current_user.username
-                                )
-                                st.success(f"Label generated: {label.label_id}")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error generating label: {str(e)}")
+                        except Exception as e:
+                            st.error(f"Error starting workflow: {str(e)}")
+                
+                # Label generation
+                if product.status == ProductStatus.APPROVED:
+                    if st.button("Generate Label", key=f"label_{product.sku}"):
+                        from core.label_generator import label_generator, LabelFormat
+                        try:
+                            product_data = {
+                                "sku": product.sku,
+                                "product_name": product.product_name,
+                                "mrp": product.mrp,
+                                "net_quantity": product.net_quantity,
+                                "unit": product.unit,
+                                "manufacturer_name": product.manufacturer_name,
+                                "mfg_date": product.mfg_date,
+                                "expiry_date": product.expiry_date,
+                                "batch_number": product.batch_number,
+                                "fssai_number": product.fssai_number,
+                                "country_of_origin": product.country_of_origin
+                            }
+                            
+                            label = label_generator.create_label_from_product(
+                                product_data,
+                                LabelFormat.STANDARD,
+                                current_user.username
+                            )
+                            _label_stats.clear()
+                            _labels_df.clear()
+                            st.success(f"Label generated: {label.label_id}")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error generating label: {str(e)}")
     else:
         st.info("No products found matching the criteria.")
 
-with tab3:
+@st.fragment
+def _workflow_tab():
+    from core.workflow_manager import workflow_manager
+    
     st.subheader("🔄 Workflow Management")
     
     # Get workflow statistics
-    workflow_stats = workflow_manager.get_workflow_statistics()
+    workflow_stats = _workflow_stats(_workflow_version(workflow_manager))
     
     # Workflow overview
     col1, col2, col3 = st.columns(3)
@@ -676,69 +754,156 @@ with tab3:
     
     if pending_workflows:
         for workflow in pending_workflows:
-            with st.expander(f"{workflow.workflow_id} - {workflow.workflow_type.value}"):
+            workflow_type = workflow.workflow_type.value
+            current_step = None
+            if workflow.current_step:
+                current_step = next((s for s in workflow.steps if s.step_id == workflow.current_step), None)
+            
+            with st.expander(f"{workflow.workflow_id} - {workflow_type}"):
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
                     st.markdown(f"**Entity:** {workflow.entity_id}")
-                    st.markdown(f"**Type:** {workflow.workflow_type.value}")
+                    st.markdown(f"**Type:** {workflow_type}")
                     st.markdown(f"**Status:** {workflow.status.value}")
                     st.markdown(f"**Initiated By:** {workflow.initiated_by}")
                     st.markdown(f"**Initiated Date:** {workflow.initiated_date[:10]}")
                     
-                    if workflow.current_step:
-                        current_step = next((s for s in workflow.steps if s.step_id == workflow.current_step), None)
-                        if current_step:
-                            st.markdown(f"**Current Step:** {current_step.step_name}")
-                            st.markdown(f"**Required Role:** {current_step.required_role}")
+                    if current_step:
+                        st.markdown(f"**Current Step:** {current_step.step_name}")
+                        st.markdown(f"**Required Role:** {current_step.required_role}")
                 
                 with col2:
-                    if workflow.current_step:
-                        current_step = next((s for s in workflow.steps if s.step_id == workflow.current_step), None)
-                        if current_step:
+                    if current_step:
+                        with st.form(f"wf_{workflow.workflow_id}"):
                             comments = st.text_area(
                                 "Comments",
                                 placeholder="Add approval comments...",
                                 key=f"comments_{workflow.workflow_id}",
                                 height=100
                             )
-                            
-                            col_approve, col_reject = st.columns(2)
-                            
-                            with col_approve:
-                                if st.button("Approve", key=f"approve_{workflow.workflow_id}"):
-                                    if workflow_manager.approve_step(
-                                        workflow.workflow_id,
-                                        workflow.current_step,
-                                        current_user.username,
-                                        comments
-                                    ):
-                                        st.success("Step approved!")
-                                        st.rerun()
-                            
-                            with col_reject:
-                                if st.button("Reject", key=f"reject_{workflow.workflow_id}"):
-                                    reason = st.text_input(
-                                        "Rejection Reason",
-                                        key=f"reason_{workflow.workflow_id}"
-                                    )
-                                    if reason:
-                                        if workflow_manager.reject_step(
-                                            workflow.workflow_id,
-                                            workflow.current_step,
-                                            current_user.username,
-                                            reason
-                                        ):
-                                            st.success("Step rejected!")
-                                            st.rerun()
+                            action = st.radio(
+                                "Action",
+                                ("Approve", "Reject"),
+                                horizontal=True,
+                                key=f"action_{workflow.workflow_id}"
+                            )
+                            reason = st.text_input(
+                                "Rejection Reason",
+                                placeholder="Required when rejecting",
+                                key=f"reason_{workflow.workflow_id}"
+                            )
+                            submitted = st.form_submit_button("Submit Decision")
+                        
+                        if submitted:
+                            if action == "Approve":
+                                if workflow_manager.approve_step(
+                                    workflow.workflow_id,
+                                    workflow.current_step,
+                                    current_user.username,
+                                    comments
+                                ):
+                                    _workflow_stats.clear()
+                                    st.success("Step approved!")
+                                    st.rerun()
+                            elif not reason:
+                                st.error("Please enter a rejection reason.")
+                            elif workflow_manager.reject_step(
+                                workflow.workflow_id,
+                                workflow.current_step,
+                                current_user.username,
+                                reason
+                            ):
+                                _workflow_stats.clear()
+                                st.success("Step rejected!")
+                                st.rerun()
     else:
         st.info("No pending workflows found.")
 
-with tab4:
+@st.fragment
+def _label_card(label):
+    """Details and actions for one label; approve/reject only rerun this card"""
+    from core.label_generator import label_generator
+    
+    label_format = label.label_format.value
+    status = label.status.value
+    gate = label.compliance_gate_status.value
+    
+    st.markdown(f"#### {label.label_id} - {label.product_sku}")
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown(_LABEL_DETAILS_TEMPLATE.format(
+            label=label,
+            label_format=label_format,
+            status=status,
+            created=label.created_date[:10],
+            gate=gate
+        ))
+        
+        if label.compliance_issues:
+            st.warning(f"**Compliance Issues:** {', '.join(label.compliance_issues)}")
+        
+        # Display label elements
+        st.markdown("  \n".join(
+            ["**Label Elements:**"] + [
+                f"{'✅' if element.compliance_checked else '❌'} {element.element_id}: {element.content}"
+                for element in label.elements
+            ]
+        ))
+    
+    with col2:
+        # Generate label image
+        if st.button("Generate Preview", key=f"preview_{label.label_id}"):
+            image_data = _preview(label.label_id, label.version)
+            if image_data:
+                st.image(image_data, caption=f"Label Preview - {label.label_id}")
+            else:
+                st.error("Failed to generate label preview")
+        
+        # Label actions
+        if gate == "PASSED" and status == "DRAFT":
+            if st.button("Approve Label", key=f"approve_label_{label.label_id}"):
+                if label_generator.approve_label(
+                    label.label_id,
+                    current_user.username,
+                    "Approved for printing"
+                ):
+                    _label_stats.clear()
+                    _labels_df.clear()
+                    st.success("Label approved!")
+                    st.rerun(scope="fragment")
+        
+        if gate == "FAILED":
+            with st.form(f"reject_label_{label.label_id}"):
+                reason = st.text_input(
+                    "Rejection Reason",
+                    key=f"reject_reason_{label.label_id}",
+                    placeholder="Enter rejection reason..."
+                )
+                rejected = st.form_submit_button("Reject Label")
+            
+            if rejected:
+                if not reason:
+                    st.error("Please enter a rejection reason.")
+                elif label_generator.reject_label(
+                    label.label_id,
+                    current_user.username,
+                    reason
+                ):
+                    _label_stats.clear()
+                    _labels_df.clear()
+                    st.success("Label rejected!")
+                    st.rerun(scope="fragment")
+
+@st.fragment
+def _label_tab():
+    from core.label_generator import label_generator
+    
     st.subheader("🏷️ Label Generation & Management")
     
     # Get label statistics
-    label_stats = label_generator.get_label_statistics()
+    label_stats = _label_stats(_file_version(label_generator.labels_file))
     
     # Label overview
     col1, col2, col3 = st.columns(3)
@@ -756,157 +921,70 @@ with tab4:
     st.subheader("📋 Label Management")
     
     # Get all labels
-    all_labels = label_generator.labels
-    
-    if all_labels:
-        for label in all_labels:
-            with st.expander(f"{label.label_id} - {label.product_sku}"):
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    st.markdown(f"**Product SKU:** {label.product_sku}")
-                    st.markdown(f"**Format:** {label.label_format.value}")
-                    st.markdown(f"**Status:** {label.status.value}")
-                    st.markdown(f"**Created By:** {label.created_by}")
-                    st.markdown(f"**Created Date:** {label.created_date[:10]}")
-                    st.markdown(f"**Compliance Gate:** {label.compliance_gate_status.value}")
-                    
-                    if label.compliance_issues:
-                        st.warning(f"**Compliance Issues:** {', '.join(label.compliance_issues)}")
-                    
-                    # Display label elements
-                    st.markdown("**Label Elements:**")
-                    for element in label.elements:
-                        status_icon = "✅" if element.compliance_checked else "❌"
-                        st.write(f"{status_icon} {element.element_id}: {element.content}")
-                
-                with col2:
-                    # Generate label image
-                    if st.button("Generate Preview", key=f"preview_{label.label_id}"):
-                        image_data = label_generator.generate_label_image(label.label_id)
-                        if image_data:
-                            st.image(image_data, caption=f"Label Preview - {label.label_id}")
-                        else:
-                            st.error("Failed to generate label preview")
-                    
-                    # Label actions
-                    if label.compliance_gate_status.value == "PASSED" and label.status.value == "DRAFT":
-                        if st.button("Approve Label", key=f"approve_label_{label.label_id}"):
-                            if label_generator.approve_label(
-                                label.label_id,
-                                current_user.username,
-                                "Approved for printing"
-                            ):
-                                st.success("Label approved!")
-                                st.rerun()
-                    
-                    if label.compliance_gate_status.value == "FAILED":
-                        if st.button("Reject Label", key=f"reject_label_{label.label_id}"):
-                            reason = st.text_input(
-                                "Rejection Reason",
-                                key=f"reject_reason_{label.label_id}",
-                                placeholder="Enter rejection reason..."
-                            )
-                            if reason:
-                                if label_generator.reject_label(
-                                    label.label_id,
-                                    current_user.username,
-                                    reason
-                                ):
-                                    st.success("Label rejected!")
-                                    st.rerun()
+    labels_df = _labels_df(_file_version(label_generator.labels_file))
+    
+    if not labels_df.empty:
+        event = st.dataframe(
+            labels_df,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="labels_table"
+        )
+        
+        selected_rows = [row for row in event.selection.rows if row < len(labels_df)]
+        label = label_generator.labels_by_id.get(labels_df["Label ID"].iloc[selected_rows[0]]) if selected_rows else None
+        if label is None:
+            st.caption("Select a label to see its elements, preview it or approve/reject it.")
+        else:
+            _label_card(label)
     else:
         st.info("No labels generated yet.")
 
-with tab5:
+@st.fragment
+def _analytics_tab():
+    from core.workflow_manager import workflow_manager
+    
     st.subheader("📈 Analytics & Reports")
     
+    stats = _compute_stats(_products_df())
+    workflow_stats = _workflow_stats(_workflow_version(workflow_manager))
+    
     # Export options
     col1, col2, col3 = st.columns(3)
     
     with col1:
         if st.button("📊 Export Product Summary"):
-            summary_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "product_statistics": stats,
-                "workflow_statistics": workflow_stats,
-                "label_statistics": label_stats
-            }
+            from core.label_generator import label_generator
             
-            st.download_button(
-                label="Download Summary Report",
-                data=safe_json_dumps(summary_data, indent=2),
-                file_name=f"erp_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+            _download(
+                "Download Summary Report", "erp_summary", current_user.username,
+                product_statistics={
+                    key: value.to_dict() if isinstance(value, pd.Series) else value
+                    for key, value in stats.items()
+                },
+                workflow_statistics=workflow_stats,
+                label_statistics=_label_stats(_file_version(label_generator.labels_file))
             )
     
     with col2:
         if st.button("📋 Export All Products"):
-            products_data = []
-            for product in erp_manager.get_all_products():
-                product_dict = {
-                    "sku": product.sku,
-                    "product_name": product.product_name,
-                    "mrp": product.mrp,
-                    "net_quantity": product.net_quantity,
-                    "unit": product.unit,
-                    "manufacturer_name": product.manufacturer_name,
-                    "category": product.category.value,
-                    "status": product.status.value,
-                    "compliance_status": product.compliance_status,
-                    "created_date": product.created_date,
-                    "tags": product.tags
-                }
-                products_data.append(product_dict)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "products": products_data
-            }
-            
-            st.download_button(
-                label="Download Products Data",
-                data=safe_json_dumps(export_data, indent=2),
-                file_name=f"erp_products_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+            _download(
+                "Download Products Data", "erp_products", current_user.username,
+                rows_key="products",
+                rows=(
+                    dict(zip(PRODUCT_EXPORT_FIELDS, _product_export_getter(product)))
+                    for product in _products()
+                )
             )
     
     with col3:
         if st.button("🔄 Export Workflows"):
-            workflows_data = []
-            for workflow in workflow_manager.workflows:
-                workflow_dict = {
-                    "workflow_id": workflow.workflow_id,
-                    "workflow_type": workflow.workflow_type.value,
-                    "entity_id": workflow.entity_id,
-                    "status": workflow.status.value,
-                    "initiated_by": workflow.initiated_by,
-                    "initiated_date": workflow.initiated_date,
-                    "completed_date": workflow.completed_date,
-                    "steps": [
-                        {
-                            "step_name": step.step_name,
-                            "required_role": step.required_role,
-                            "status": step.status.value,
-                            "completed_date": step.completed_date
-                        } for step in workflow.steps
-                    ]
-                }
-                workflows_data.append(workflow_dict)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "workflows": workflows_data
-            }
-            
-            st.download_button(
-                label="Download Workflows Data",
-                data=safe_json_dumps(export_data, indent=2),
-                file_name=f"workflows_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
+            _download(
+                "Download Workflows Data", "workflows", current_user.username,
+                rows_key="workflows",
+                rows=_workflow_rows(workflow_manager.workflows)
             )
     
     # Analytics charts
@@ -916,22 +994,45 @@ with tab5:
     
     with col1:
         st.markdown("**Product Status Distribution**")
-        if stats["by_status"]:
-            status_df = pd.DataFrame(list(stats["by_status"].items()), columns=["Status", "Count"])
-            st.bar_chart(status_df.set_index("Status"))
+        if stats["total_products"]:
+            st.bar_chart(stats["by_status"])
         else:
             st.info("No product data available.")
     
     with col2:
         st.markdown("**Workflow Status Distribution**")
         if workflow_stats["by_status"]:
-            workflow_status_df = pd.DataFrame(list(workflow_stats["by_status"].items()), columns=["Status", "Count"])
-            st.bar_chart(workflow_status_df.set_index("Status"))
+            st.bar_chart(_series(tuple(workflow_stats["by_status"].items())))
         else:
             st.info("No workflow data available.")
 
-# Log page access
-log_user_action(
+# Create tabs for different ERP functions
+tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    "📝 Product Data Entry", 
+    "📊 Product Dashboard", 
+    "🔄 Workflow Management", 
+    "🏷️ Label Generation",
+    "📈 Analytics & Reports"
+])
+
+with tab1:
+    _product_entry_tab()
+
+with tab2:
+    _product_dashboard_tab()
+
+with tab3:
+    _workflow_tab()
+
+with tab4:
+    _label_tab()
+
+with tab5:
+    _analytics_tab()
+
+# Log page access off the render path
+_log_executor().submit(
+    log_user_action,
     current_user.username,
     "PAGE_ACCESS",
     "erp_product_management",
@@ -1,6 +1,9 @@
+import heapq
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from core.auth import require_admin, get_current_user
 from core.physical_integration import (
@@ -10,192 +13,215 @@ from core.physical_integration import (
 from core.label_generator import label_generator, LabelStatus
 from core.erp_manager import erp_manager, ProductStatus
 from core.audit_logger import log_user_action
-from core.json_utils import safe_json_dumps
+from core.json_utils import safe_json_bytes
 
 st.set_page_config(page_title="Physical Systems Integration - Legal Metrology Checker", page_icon="🔧", layout="wide")
 
+PRINT_JOBS_PER_PAGE = 25
+_DEVICE_STATUS_ICON = {
+    "CONNECTED": "🟢",
+    "DISCONNECTED": "🔴",
+    "CONNECTING": "🟡",
+    "ERROR": "🔴",
+    "MAINTENANCE": "🟠"
+}
+_PRINT_STATUS_ICON = {
+    "PENDING": "🟡",
+    "PRINTING": "🔵",
+    "COMPLETED": "🟢",
+    "FAILED": "🔴",
+    "CANCELLED": "⚪"
+}
+_VISION_STATUS_ICON = {
+    "PENDING": "🟡",
+    "IN_PROGRESS": "🔵",
+    "PASSED": "🟢",
+    "FAILED": "🔴",
+    "ERROR": "🔴"
+}
+_RECENT_JOB_ICON = {"COMPLETED": "✅", "PENDING": "⏳", "PRINTING": "🖨️", "FAILED": "❌"}
+_RECENT_CHECK_ICON = {"PASSED": "✅", "FAILED": "❌", "PENDING": "⏳", "IN_PROGRESS": "👁️"}
+_DEVICE_TYPE_VALUES = tuple(device_type.value for device_type in DeviceType)
+_PRIORITY_OPTIONS = (1, 2, 3, 4, 5)
+_PRINT_STATUS_VALUES = tuple(status.value for status in PrintStatus)
+_VISION_STATUS_VALUES = tuple(status.value for status in VisionCheckStatus)
+_PRINT_STATUS_FILTER_OPTIONS = ("All",) + _PRINT_STATUS_VALUES
+_VISION_STATUS_FILTER_OPTIONS = ("All",) + _VISION_STATUS_VALUES
+
+def _results_markdown(title, results):
+    """One markdown block for a vision analysis dict: booleans as ticks, other values inline"""
+    lines = [f"**{title}:**"]
+    for key, value in results.items():
+        name = key.replace("_", " ").title()
+        if isinstance(value, bool):
+            lines.append(f"{'✅' if value else '❌'} {name}")
+        else:
+            lines.append(f"**{name}:** {value}")
+    return "  \n".join(lines)
+
+# Snapshots are keyed on the manager's change counters, so reruns that only
+# move a widget reuse the previous lists instead of rescanning the manager
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _devices_snapshot(version):
+    return list(physical_integration_manager.devices)
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _connected_devices_snapshot(version):
+    return physical_integration_manager.get_connected_devices()
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _print_jobs_snapshot(version, status="All", device="All"):
+    """Matching print jobs, newest first"""
+    jobs = physical_integration_manager.get_print_jobs(
+        status=PrintStatus(status) if status != "All" else None,
+        device_id=device if device != "All" else None
+    )
+    jobs.sort(key=attrgetter("created_date"), reverse=True)
+    return jobs
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _vision_checks_snapshot(version, status="All", sku="All"):
+    return physical_integration_manager.get_vision_checks(
+        status=VisionCheckStatus(status) if status != "All" else None,
+        product_sku=sku if sku != "All" else None
+    )
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _recent_vision_checks(version, limit=5):
+    return heapq.nlargest(limit, _vision_checks_snapshot(version), key=attrgetter("performed_date"))
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _distinct_vision_skus(version):
+    return tuple(sorted({check.product_sku for check in physical_integration_manager.vision_checks}))
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _devices_table(version):
+    devices = _devices_snapshot(version)
+    return pd.DataFrame({
+        "Device ID": [device.device_id for device in devices],
+        "Name": [device.device_name for device in devices],
+        "Type": [device.device_type.value for device in devices],
+        "Manufacturer": [f"{device.manufacturer} {device.model}" for device in devices],
+        "Status": [device.status.value for device in devices],
+        "IP Address": [device.ip_address or "" for device in devices],
+        "Last Heartbeat": [device.heartbeat_short for device in devices],
+    })
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _print_jobs_table(version, status="All", device="All", page=1):
+    jobs = _print_jobs_snapshot(version, status, device)[(page - 1) * PRINT_JOBS_PER_PAGE:page * PRINT_JOBS_PER_PAGE]
+    return pd.DataFrame({
+        "Job ID": [job.job_id for job in jobs],
+        "Product SKU": [job.product_sku for job in jobs],
+        "Label ID": [job.label_id for job in jobs],
+        "Device": [job.device_id for job in jobs],
+        "Status": [job.status.value for job in jobs],
+        "Copies": [job.copies for job in jobs],
+        "Created By": [job.created_by for job in jobs],
+        "Created": [job.created_short for job in jobs],
+    })
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _vision_checks_table(version, status="All", sku="All"):
+    checks = _vision_checks_snapshot(version, status, sku)
+    return pd.DataFrame({
+        "Check ID": [check.check_id for check in checks],
+        "Product SKU": [check.product_sku for check in checks],
+        "Status": [check.status.value for check in checks],
+        "Compliance Score": [check.compliance_score or None for check in checks],
+        "Performed By": [check.performed_by for check in checks],
+        "Date": [check.performed_short for check in checks],
+    })
+
+def _selected_item(event, table_key, shown, id_attr, pool=None):
+    """Item picked in a selectable table, followed by id rather than by row position"""
+    # A click reports a position in the table as the previous run drew it, and rows
+    # added since then shift what sits at that position, so keep the ids each run
+    # drew and pin the selection to the id that was clicked
+    state = st.session_state.get(f"{table_key}_selection", {})
+    rows = tuple(event.selection.rows)
+    ids = [getattr(item, id_attr) for item in shown]
+    if rows and rows == state.get("rows"):
+        selected_id = state.get("id")
+    else:
+        drawn_ids = state.get("ids", ids)
+        selected_id = drawn_ids[rows[0]] if rows and rows[0] < len(drawn_ids) else None
+    st.session_state[f"{table_key}_selection"] = {"rows": rows, "id": selected_id, "ids": ids}
+    return next((item for item in (pool or shown) if getattr(item, id_attr) == selected_id), None)
+
+def _file_version(*paths):
+    """Cheap change token for cached reads: modification times of the backing files"""
+    return tuple(path.stat().st_mtime_ns if path.exists() else 0 for path in paths)
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _approved_labels(version):
+    return label_generator.get_labels_by_status(LabelStatus.APPROVED)
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _dispatched_products(version):
+    return erp_manager.get_products_by_status(ProductStatus.DISPATCHED)
+
+@st.cache_data(show_spinner=False)
+def _status_counts(items):
+    """Chart frame for (status, count) pairs, reused while the pairs are unchanged"""
+    return pd.DataFrame(items, columns=["Status", "Count"]).set_index("Status")
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _integration_stats(version):
+    return physical_integration_manager.get_integration_statistics()
+
+# Export payload key -> (snapshot, manager version counter, exported attributes);
+# a dotted attribute is exported under its first part, e.g. status.value as status
+_EXPORTS = {
+    "devices": (_devices_snapshot, "devices_version", (
+        "device_id", "device_name", "device_type.value", "manufacturer", "model",
+        "status.value", "ip_address", "port", "capabilities", "config"
+    )),
+    "print_jobs": (_print_jobs_snapshot, "print_jobs_version", (
+        "job_id", "label_id", "product_sku", "device_id", "status.value",
+        "created_by", "created_date", "copies", "success_count", "failure_count"
+    )),
+    "vision_checks": (_vision_checks_snapshot, "vision_version", (
+        "check_id", "product_sku", "status.value", "performed_by", "performed_date",
+        "compliance_score", "confidence_level", "detected_issues"
+    )),
+}
+_EXPORT_BUTTONS = (
+    ("devices", "📊 Export Device Configuration", "Download Device Config", "device_config"),
+    ("print_jobs", "🖨️ Export Print Jobs", "Download Print Jobs", "print_jobs"),
+    ("vision_checks", "👁️ Export Vision Checks", "Download Vision Checks", "vision_checks"),
+)
+
+@st.cache_data(ttl="30s", max_entries=8, show_spinner=False)
+def _export_body(kind, version):
+    """Encoded rows for one collection, as an indent=2 object, built once per data version"""
+    snapshot, _, fields = _EXPORTS[kind]
+    keys = [field.split(".")[0] for field in fields]
+    getter = attrgetter(*fields)
+    return safe_json_bytes({kind: [dict(zip(keys, getter(item))) for item in snapshot(version)]}, indent=2)
+
+def _export_payload(kind, version, exported_by):
+    """Encoded export for one collection, stamped with the time it is served"""
+    header = safe_json_bytes({
+        "export_timestamp": datetime.now().isoformat(),
+        "exported_by": exported_by,
+    }, indent=2)
+    # Join the two indent=2 objects into one: drop the header's closing "\n}" and the body's opening "{\n"
+    return header[:-2] + b",\n" + _export_body(kind, version)[2:]
+
 # Enhanced Custom CSS for Physical Systems Integration
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styles */
-    .main {
-        font-family: 'Inter', sans-serif;
-    }
-    
-    /* Physical Systems Header */
-    .physical-header {
-        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-        padding: 3rem 2rem;
-        border-radius: 20px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 30px rgba(255, 107, 107, 0.3);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .physical-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="gears" width="20" height="20" patternUnits="userSpaceOnUse"><circle cx="10" cy="10" r="8" fill="none" stroke="white" opacity="0.1" stroke-width="2"/><circle cx="10" cy="10" r="4" fill="none" stroke="white" opacity="0.1" stroke-width="1"/></pattern></defs><rect width="100" height="100" fill="url(%23gears)"/></svg>');
-        opacity: 0.1;
-    }
-    
-    .physical-header h1 {
-        font-size: 3rem;
-        font-weight: 700;
-        margin: 0;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    /* Device Status Cards */
-    .device-status-card {
-        background: rgba(255, 255, 255, 0.95);
-        backdrop-filter: blur(10px);
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 0.5rem 0;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: all 0.3s ease;
-    }
-    
-    .device-status-card.connected {
-        border-left: 4px solid #4CAF50;
-        background: linear-gradient(135deg, rgba(76, 175, 80, 0.1) 0%, rgba(76, 175, 80, 0.05) 100%);
-    }
-    
-    .device-status-card.disconnected {
-        border-left: 4px solid #f44336;
-        background: linear-gradient(135deg, rgba(244, 67, 54, 0.1) 0%, rgba(244, 67, 54, 0.05) 100%);
-    }
-    
-    .device-status-card.maintenance {
-        border-left: 4px solid #ff9800;
-        background: linear-gradient(135deg, rgba(255, 152, 0, 0.1) 0%, rgba(255, 152, 0, 0.05) 100%);
-    }
-    
-    /* System Metric Cards */
-    .system-metric-card {
-        background: white;
-        padding: 2rem;
-        border-radius: 20px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-        border: 1px solid rgba(255,255,255,0.2);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        position: relative;
-        overflow: hidden;
-        text-align: center;
-    }
-    
-    .system-metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 15px 40px rgba(0,0,0,0.15);
-    }
-    
-    .system-metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-    }
-    
-    /* Device Grid */
-    .device-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 1.5rem;
-        margin: 1rem 0;
-    }
-    
-    .device-card {
-        background: white;
-        border-radius: 15px;
-        padding: 1.5rem;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        border: 1px solid #e0e0e0;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .device-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-        border-color: #ff6b6b;
-    }
-    
-    .device-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 4px;
-        height: 100%;
-        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-    }
-    
-    /* Physical Tab Styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: white;
-        border-radius: 10px 10px 0 0;
-        padding: 1rem 2rem;
-        border: 1px solid #e0e0e0;
-        font-weight: 600;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #ff6b6b 0%, #ee5a24 100%);
-        color: white;
-    }
-    
-    /* Operation Status */
-    .operation-status {
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-weight: 600;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    
-    .operation-status.success {
-        background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-        color: white;
-    }
-    
-    .operation-status.error {
-        background: linear-gradient(135deg, #f44336 0%, #d32f2f 100%);
-        color: white;
-    }
-    
-    .operation-status.warning {
-        background: linear-gradient(135deg, #ff9800 0%, #f57c00 100%);
-        color: white;
-    }
-    
-    /* Alert Enhancements */
-    .stAlert {
-        border-radius: 15px !important;
-        border: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+_FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+"""
+
+@st.cache_data
+def _physical_css() -> str:
+    return f"{_FONT_LINKS}<style>\n{Path('app/static/physical_systems.css').read_text(encoding='utf-8')}</style>"
+
+st.markdown(_physical_css(), unsafe_allow_html=True)
 
 # Require admin access
 require_admin()
@@ -209,22 +235,15 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-# Create tabs for different integration functions
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "🖥️ Device Management", 
-    "🖨️ Print Operations", 
-    "👁️ Vision Inspection", 
-    "📊 Integration Dashboard",
-    "⚙️ System Configuration"
-])
-
-with tab1:
+@st.fragment
+def _device_tab():
     st.markdown("### 🖥️ Device Management")
     st.markdown("Manage physical devices including printers, vision systems, and scanners.")
     
     # Device overview
-    devices = physical_integration_manager.devices
-    connected_devices = physical_integration_manager.get_connected_devices()
+    devices_version = physical_integration_manager.devices_version
+    devices = _devices_snapshot(devices_version)
+    connected_devices = _connected_devices_snapshot(devices_version)
     
     col1, col2, col3 = st.columns(3)
     
@@ -257,65 +276,69 @@ with tab1:
     st.subheader("📋 Device List")
     
     if devices:
-        for device in devices:
-            with st.expander(f"{device.device_id} - {device.device_name}"):
-                col1, col2 = st.columns([2, 1])
+        event = st.dataframe(
+            _devices_table(devices_version),
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="devices_table"
+        )
+        
+        device = _selected_item(event, "devices_table", devices, "device_id")
+        if device is None:
+            st.caption("Select a device to connect, configure or test it.")
+        else:
+            st.markdown(f"#### {device.device_id} - {device.device_name}")
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                details = [
+                    f"**Status:** {_DEVICE_STATUS_ICON.get(device.status.value, '⚪')} {device.status.value}",
+                    f"**Type:** {device.device_type.value}",
+                    f"**Manufacturer:** {device.manufacturer} {device.model}",
+                ]
+                if device.ip_address:
+                    details.append(f"**IP Address:** {device.ip_address}")
+                if device.port:
+                    details.append(f"**Port:** {device.port}")
+                details.append(f"**Capabilities:** {', '.join(device.capabilities)}")
+                if device.last_heartbeat:
+                    details.append(f"**Last Heartbeat:** {device.heartbeat_short}")
                 
-                with col1:
-                    # Status indicator
-                    status_color = {
-                        "CONNECTED": "🟢",
-                        "DISCONNECTED": "🔴", 
-                        "CONNECTING": "🟡",
-                        "ERROR": "🔴",
-                        "MAINTENANCE": "🟠"
-                    }
-                    
-                    st.markdown(f"**Status:** {status_color.get(device.status.value, '⚪')} {device.status.value}")
-                    st.markdown(f"**Type:** {device.device_type.value}")
-                    st.markdown(f"**Manufacturer:** {device.manufacturer} {device.model}")
-                    
-                    if device.ip_address:
-                        st.markdown(f"**IP Address:** {device.ip_address}")
-                    if device.port:
-                        st.markdown(f"**Port:** {device.port}")
-                    
-                    st.markdown(f"**Capabilities:** {', '.join(device.capabilities)}")
-                    
-                    if device.last_heartbeat:
-                        st.markdown(f"**Last Heartbeat:** {device.last_heartbeat[:19]}")
-                    
-                    if device.error_count > 0:
-                        st.warning(f"**Error Count:** {device.error_count}")
-                        if device.last_error:
-                            st.error(f"**Last Error:** {device.last_error}")
+                st.markdown("  \n".join(details))
+                
+                if device.error_count > 0:
+                    st.warning(f"**Error Count:** {device.error_count}")
+                    if device.last_error:
+                        st.error(f"**Last Error:** {device.last_error}")
                 
-                with col2:
-                    # Device actions
-                    if device.status == IntegrationStatus.DISCONNECTED:
-                        if st.button("🔌 Connect", key=f"connect_{device.device_id}"):
-                            if physical_integration_manager.connect_device(device.device_id):
-                                st.success("Device connected successfully!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to connect device")
+            with col2:
+                # Device actions
+                if device.status == IntegrationStatus.DISCONNECTED:
+                    if st.button("🔌 Connect", key=f"connect_{device.device_id}"):
+                        if physical_integration_manager.connect_device(device.device_id):
+                            st.toast("Device connected successfully!", icon="✅")
+                            st.rerun()
+                        else:
+                            st.error("Failed to connect device")
                     
-                    elif device.status == IntegrationStatus.CONNECTED:
-                        if st.button("🔌 Disconnect", key=f"disconnect_{device.device_id}"):
-                            if physical_integration_manager.disconnect_device(device.device_id):
-                                st.success("Device disconnected successfully!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to disconnect device")
+                elif device.status == IntegrationStatus.CONNECTED:
+                    if st.button("🔌 Disconnect", key=f"disconnect_{device.device_id}"):
+                        if physical_integration_manager.disconnect_device(device.device_id):
+                            st.toast("Device disconnected successfully!", icon="✅")
+                            st.rerun()
+                        else:
+                            st.error("Failed to disconnect device")
                     
-                    # Device configuration
-                    if st.button("⚙️ Configure", key=f"config_{device.device_id}"):
-                        st.info("Device configuration panel would open here")
+                # Device configuration
+                if st.button("⚙️ Configure", key=f"config_{device.device_id}"):
+                    st.info("Device configuration panel would open here")
                     
-                    # Test device
-                    if st.button("🧪 Test", key=f"test_{device.device_id}"):
-                        st.info(f"Testing {device.device_name}...")
-                        st.success("Device test completed successfully!")
+                # Test device
+                if st.button("🧪 Test", key=f"test_{device.device_id}"):
+                    st.info(f"Testing {device.device_name}...")
+                    st.success("Device test completed successfully!")
     else:
         st.info("No devices configured yet.")
     
@@ -329,7 +352,7 @@ with tab1:
             device_name = st.text_input("Device Name", placeholder="Enter device name")
             device_type = st.selectbox(
                 "Device Type",
-                options=[dt.value for dt in DeviceType],
+                options=_DEVICE_TYPE_VALUES,
                 format_func=lambda x: x.replace("_", " ").title()
             )
             manufacturer = st.text_input("Manufacturer", placeholder="Enter manufacturer name")
@@ -348,7 +371,7 @@ with tab1:
         submitted = st.form_submit_button("➕ Add Device", type="primary")
         
         if submitted:
-            if not all([device_name, manufacturer, model]):
+            if not (device_name and manufacturer and model):
                 st.error("Please fill in all required fields.")
             else:
                 try:
@@ -364,8 +387,7 @@ with tab1:
                         capabilities=capability_list
                     )
                     
-                    st.success(f"✅ Device added successfully!")
-                    st.info(f"**Device ID:** {device.device_id}")
+                    st.toast(f"Device {device.device_id} added successfully!", icon="✅")
                     
                     log_user_action(
                         current_user.username,
@@ -379,13 +401,18 @@ with tab1:
                 except Exception as e:
                     st.error(f"Error adding device: {str(e)}")
 
-with tab2:
+@st.fragment
+def _print_tab():
     st.subheader("🖨️ Print Operations")
     st.markdown("Manage label printing operations with compliance validation.")
     
+    devices_version = physical_integration_manager.devices_version
+    devices = _devices_snapshot(devices_version)
+    connected_devices = _connected_devices_snapshot(devices_version)
+    
     # Print job overview
-    print_jobs = physical_integration_manager.print_jobs
-    pending_jobs = physical_integration_manager.get_print_jobs_by_status(PrintStatus.PENDING)
+    print_jobs_version = physical_integration_manager.print_jobs_version
+    print_jobs = _print_jobs_snapshot(print_jobs_version)
     
     col1, col2, col3 = st.columns(3)
     
@@ -393,34 +420,35 @@ with tab2:
         st.metric("Total Print Jobs", len(print_jobs))
     
     with col2:
-        st.metric("Pending Jobs", len(pending_jobs))
+        st.metric("Pending Jobs", physical_integration_manager.count_print_jobs_by_status(PrintStatus.PENDING))
     
     with col3:
-        completed_jobs = len(physical_integration_manager.get_print_jobs_by_status(PrintStatus.COMPLETED))
+        completed_jobs = physical_integration_manager.count_print_jobs_by_status(PrintStatus.COMPLETED)
         st.metric("Completed Jobs", completed_jobs)
     
     # Create new print job
     st.subheader("📝 Create Print Job")
     
     # Get approved labels
-    approved_labels = label_generator.get_labels_by_status(LabelStatus.APPROVED)
+    approved_labels = _approved_labels(_file_version(label_generator.labels_file))
     
     if approved_labels:
         with st.form("create_print_job_form"):
             col1, col2 = st.columns(2)
             
             with col1:
-                label_options = {f"{label.label_id} - {label.product_sku}": label.label_id 
-                               for label in approved_labels}
-                selected_label = st.selectbox("Select Label", options=list(label_options.keys()))
-                selected_label_id = label_options[selected_label]
+                selected_label = st.selectbox(
+                    "Select Label",
+                    options=approved_labels,
+                    format_func=lambda label: f"{label.label_id} - {label.product_sku}"
+                )
+                selected_label_id = selected_label.label_id
                 
                 copies = st.number_input("Number of Copies", min_value=1, max_value=1000, value=1)
                 
             with col2:
                 # Get available printers
-                printers = physical_integration_manager.get_devices_by_type(DeviceType.PRINTER)
-                connected_printers = [p for p in printers if p.status == IntegrationStatus.CONNECTED]
+                connected_printers = [p for p in connected_devices if p.device_type == DeviceType.PRINTER]
                 
                 if connected_printers:
                     printer_options = {f"{printer.device_name} ({printer.device_id})": printer.device_id 
@@ -431,28 +459,22 @@ with tab2:
                     st.warning("No connected printers available")
                     selected_printer_id = None
                 
-                priority = st.selectbox("Priority", options=[1, 2, 3, 4, 5], index=2)
+                priority = st.selectbox("Priority", options=_PRIORITY_OPTIONS, index=2)
             
             submitted = st.form_submit_button("🖨️ Create Print Job", type="primary")
             
             if submitted and selected_printer_id:
                 try:
-                    # Get product SKU from label
-                    label = label_generator.get_label(selected_label_id)
-                    
                     job = physical_integration_manager.create_print_job(
                         label_id=selected_label_id,
-                        product_sku=label.product_sku,
+                        product_sku=selected_label.product_sku,
                         device_id=selected_printer_id,
                         created_by=current_user.username,
                         copies=copies,
                         priority=priority
                     )
                     
-                    st.success(f"✅ Print job created successfully!")
-                    st.info(f"**Job ID:** {job.job_id}")
-                    st.info(f"**Label:** {selected_label_id}")
-                    st.info(f"**Copies:** {copies}")
+                    st.toast(f"Print job {job.job_id} created: {copies} copies of {selected_label_id}", icon="✅")
                     
                     log_user_action(
                         current_user.username,
@@ -474,98 +496,107 @@ with tab2:
     st.subheader("📋 Print Job Management")
     
     if print_jobs:
-        # Filter options
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            status_filter = st.selectbox(
-                "Filter by Status",
-                options=["All"] + [status.value for status in PrintStatus],
-                format_func=lambda x: x.replace("_", " ").title()
-            )
-        
-        with col2:
-            device_filter = st.selectbox(
-                "Filter by Device",
-                options=["All"] + [device.device_id for device in devices]
-            )
+        # Filter options, applied together on submit
+        with st.form("job_filters"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                status_filter = st.selectbox(
+                    "Filter by Status",
+                    options=_PRINT_STATUS_FILTER_OPTIONS,
+                    format_func=lambda x: x.replace("_", " ").title(),
+                    key="job_status_filter"
+                )
+            
+            with col2:
+                device_filter = st.selectbox(
+                    "Filter by Device",
+                    options=["All"] + [device.device_id for device in devices],
+                    key="job_device_filter"
+                )
+            
+            st.form_submit_button("🔍 Apply Filters")
         
-        # Filter jobs
-        filtered_jobs = print_jobs
+        filtered_jobs = _print_jobs_snapshot(print_jobs_version, status_filter, device_filter)
         
-        if status_filter != "All":
-            filtered_jobs = [job for job in filtered_jobs if job.status.value == status_filter]
+        page_count = max(1, -(-len(filtered_jobs) // PRINT_JOBS_PER_PAGE))
+        if st.session_state.get("print_jobs_page", 1) > page_count:
+            st.session_state.print_jobs_page = page_count
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="print_jobs_page")
+        page_jobs = filtered_jobs[(page - 1) * PRINT_JOBS_PER_PAGE:page * PRINT_JOBS_PER_PAGE]
         
-        if device_filter != "All":
-            filtered_jobs = [job for job in filtered_jobs if job.device_id == device_filter]
+        event = st.dataframe(
+            _print_jobs_table(print_jobs_version, status_filter, device_filter, page),
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="print_jobs_table"
+        )
         
-        # Display jobs
-        for job in filtered_jobs:
-            with st.expander(f"{job.job_id} - {job.product_sku}"):
-                col1, col2 = st.columns([2, 1])
+        job = _selected_item(event, "print_jobs_table", page_jobs, "job_id", filtered_jobs)
+        if job is None:
+            st.caption("Select a print job to see its details or run it.")
+        else:
+            st.markdown(f"#### {job.job_id} - {job.product_sku}")
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                details = [
+                    f"**Status:** {_PRINT_STATUS_ICON.get(job.status.value, '⚪')} {job.status.value}",
+                    f"**Label ID:** {job.label_id}",
+                    f"**Product SKU:** {job.product_sku}",
+                    f"**Device:** {job.device_id}",
+                    f"**Copies:** {job.copies}",
+                    f"**Created By:** {job.created_by}",
+                    f"**Created Date:** {job.created_short}",
+                ]
+                if job.started_time:
+                    details.append(f"**Started:** {job.started_short}")
+                if job.completed_time:
+                    details.append(f"**Completed:** {job.completed_short}")
                 
-                with col1:
-                    # Status indicator
-                    status_color = {
-                        "PENDING": "🟡",
-                        "PRINTING": "🔵",
-                        "COMPLETED": "🟢",
-                        "FAILED": "🔴",
-                        "CANCELLED": "⚪"
-                    }
-                    
-                    st.markdown(f"**Status:** {status_color.get(job.status.value, '⚪')} {job.status.value}")
-                    st.markdown(f"**Label ID:** {job.label_id}")
-                    st.markdown(f"**Product SKU:** {job.product_sku}")
-                    st.markdown(f"**Device:** {job.device_id}")
-                    st.markdown(f"**Copies:** {job.copies}")
-                    st.markdown(f"**Created By:** {job.created_by}")
-                    st.markdown(f"**Created Date:** {job.created_date[:19]}")
-                    
-                    if job.started_time:
-                        st.markdown(f"**Started:** {job.started_time[:19]}")
-                    if job.completed_time:
-                        st.markdown(f"**Completed:** {job.completed_time[:19]}")
-                    
-                    if job.success_count > 0:
-                        st.success(f"**Success Count:** {job.success_count}")
-                    if job.failure_count > 0:
-                        st.error(f"**Failure Count:** {job.failure_count}")
-                    if job.error_message:
-                        st.error(f"**Error:** {job.error_message}")
+                st.markdown("  \n".join(details))
+                
+                if job.success_count > 0:
+                    st.success(f"**Success Count:** {job.success_count}")
+                if job.failure_count > 0:
+                    st.error(f"**Failure Count:** {job.failure_count}")
+                if job.error_message:
+                    st.error(f"**Error:** {job.error_message}")
                 
-                with col2:
-                    # Job actions
-                    if job.status == PrintStatus.PENDING:
-                        if st.button("▶️ Execute", key=f"execute_{job.job_id}"):
-                            if physical_integration_manager.execute_print_job(job.job_id):
-                                st.success("Print job executed successfully!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to execute print job")
+            with col2:
+                # Job actions
+                if job.status == PrintStatus.PENDING:
+                    if st.button("▶️ Execute", key=f"execute_{job.job_id}"):
+                        if physical_integration_manager.execute_print_job(job.job_id):
+                            st.toast("Print job executed successfully!", icon="✅")
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("Failed to execute print job")
                     
-                    if job.status == PrintStatus.COMPLETED:
-                        st.success("✅ Job completed")
+                if job.status == PrintStatus.COMPLETED:
+                    st.success("✅ Job completed")
                     
-                    if job.status == PrintStatus.FAILED:
-                        st.error("❌ Job failed")
-                        if st.button("🔄 Retry", key=f"retry_{job.job_id}"):
-                            # Reset job status and retry
-                            job.status = PrintStatus.PENDING
-                            job.error_message = None
-                            physical_integration_manager._save_print_jobs()
-                            st.success("Job reset for retry")
-                            st.rerun()
+                if job.status == PrintStatus.FAILED:
+                    st.error("❌ Job failed")
+                    if st.button("🔄 Retry", key=f"retry_{job.job_id}"):
+                        if physical_integration_manager.reset_print_job(job.job_id):
+                            st.toast("Job reset for retry", icon="🔄")
+                            st.rerun(scope="fragment")
     else:
         st.info("No print jobs created yet.")
 
-with tab3:
+@st.fragment
+def _vision_tab():
     st.subheader("👁️ Vision Inspection")
     st.markdown("Perform vision-based compliance validation on printed labels.")
     
     # Vision check overview
-    vision_checks = physical_integration_manager.vision_checks
-    pending_checks = physical_integration_manager.get_vision_checks_by_status(VisionCheckStatus.PENDING)
+    vision_version = physical_integration_manager.vision_version
+    vision_checks = _vision_checks_snapshot(vision_version)
     
     col1, col2, col3 = st.columns(3)
     
@@ -573,17 +604,17 @@ with tab3:
         st.metric("Total Vision Checks", len(vision_checks))
     
     with col2:
-        st.metric("Pending Checks", len(pending_checks))
+        st.metric("Pending Checks", physical_integration_manager.count_vision_checks_by_status(VisionCheckStatus.PENDING))
     
     with col3:
-        passed_checks = len(physical_integration_manager.get_vision_checks_by_status(VisionCheckStatus.PASSED))
+        passed_checks = physical_integration_manager.count_vision_checks_by_status(VisionCheckStatus.PASSED)
         st.metric("Passed Checks", passed_checks)
     
     # Create new vision check
     st.subheader("📸 Create Vision Check")
     
     # Get dispatched products
-    dispatched_products = erp_manager.get_products_by_status(ProductStatus.DISPATCHED)
+    dispatched_products = _dispatched_products(_file_version(erp_manager.products_file))
     
     if dispatched_products:
         with st.form("create_vision_check_form"):
@@ -612,9 +643,7 @@ with tab3:
                         performed_by=current_user.username
                     )
                     
-                    st.success(f"✅ Vision check created successfully!")
-                    st.info(f"**Check ID:** {check.check_id}")
-                    st.info(f"**Product SKU:** {selected_sku}")
+                    st.toast(f"Vision check {check.check_id} created for {selected_sku}", icon="✅")
                     
                     log_user_action(
                         current_user.username,
@@ -634,120 +663,117 @@ with tab3:
     st.subheader("📋 Vision Check Management")
     
     if vision_checks:
-        # Filter options
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            status_filter = st.selectbox(
-                "Filter by Status",
-                options=["All"] + [status.value for status in VisionCheckStatus],
-                format_func=lambda x: x.replace("_", " ").title(),
-                key="vision_status_filter"
-            )
-        
-        with col2:
-            product_filter = st.selectbox(
-                "Filter by Product",
-                options=["All"] + list(set([check.product_sku for check in vision_checks])),
-                key="vision_product_filter"
-            )
-        
-        # Filter checks
-        filtered_checks = vision_checks
+        # Filter options, applied together on submit
+        with st.form("vision_filters"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                status_filter = st.selectbox(
+                    "Filter by Status",
+                    options=_VISION_STATUS_FILTER_OPTIONS,
+                    format_func=lambda x: x.replace("_", " ").title(),
+                    key="vision_status_filter"
+                )
+            
+            with col2:
+                product_filter = st.selectbox(
+                    "Filter by Product",
+                    options=("All",) + _distinct_vision_skus(vision_version),
+                    key="vision_product_filter"
+                )
+            
+            st.form_submit_button("🔍 Apply Filters")
         
-        if status_filter != "All":
-            filtered_checks = [check for check in filtered_checks if check.status.value == status_filter]
+        filtered_checks = _vision_checks_snapshot(vision_version, status_filter, product_filter)
         
-        if product_filter != "All":
-            filtered_checks = [check for check in filtered_checks if check.product_sku == product_filter]
+        event = st.dataframe(
+            _vision_checks_table(vision_version, status_filter, product_filter),
+            column_config={"Compliance Score": st.column_config.NumberColumn(format="%.1f%%")},
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="vision_checks_table"
+        )
         
-        # Display checks
-        for check in filtered_checks:
-            with st.expander(f"{check.check_id} - {check.product_sku}"):
-                col1, col2 = st.columns([2, 1])
+        check = _selected_item(event, "vision_checks_table", filtered_checks, "check_id")
+        if check is None:
+            st.caption("Select a vision check to see its analysis or run it.")
+        else:
+            st.markdown(f"#### {check.check_id} - {check.product_sku}")
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                details = [
+                    f"**Status:** {_VISION_STATUS_ICON.get(check.status.value, '⚪')} {check.status.value}",
+                    f"**Product SKU:** {check.product_sku}",
+                    f"**Image Path:** {check.image_path}",
+                    f"**Performed By:** {check.performed_by}",
+                    f"**Date:** {check.performed_short}",
+                ]
+                if check.compliance_score > 0:
+                    details.append(f"**Compliance Score:** {check.compliance_score:.1f}%")
+                    details.append(f"**Confidence Level:** {check.confidence_level:.1f}%")
+                
+                st.markdown("  \n".join(details))
                 
-                with col1:
-                    # Status indicator
-                    status_color = {
-                        "PENDING": "🟡",
-                        "IN_PROGRESS": "🔵",
-                        "PASSED": "🟢",
-                        "FAILED": "🔴",
-                        "ERROR": "🔴"
-                    }
+                if check.compliance_score > 0:
+                    # Quality scores
+                    col_quality1, col_quality2, col_quality3 = st.columns(3)
+                    with col_quality1:
+                        st.metric("Image Quality", f"{check.image_quality_score:.1f}%")
+                    with col_quality2:
+                        st.metric("Lighting", f"{check.lighting_score:.1f}%")
+                    with col_quality3:
+                        st.metric("Sharpness", f"{check.sharpness_score:.1f}%")
+                        
+                    # Analysis results
+                    if check.text_recognition_results:
+                        st.markdown(_results_markdown("Text Recognition Results", check.text_recognition_results))
                     
-                    st.markdown(f"**Status:** {status_color.get(check.status.value, '⚪')} {check.status.value}")
-                    st.markdown(f"**Product SKU:** {check.product_sku}")
-                    st.markdown(f"**Image Path:** {check.image_path}")
-                    st.markdown(f"**Performed By:** {check.performed_by}")
-                    st.markdown(f"**Date:** {check.performed_date[:19]}")
+                    if check.compliance_analysis:
+                        st.markdown(_results_markdown("Compliance Analysis", check.compliance_analysis))
                     
-                    if check.compliance_score > 0:
-                        st.markdown(f"**Compliance Score:** {check.compliance_score:.1f}%")
-                        st.markdown(f"**Confidence Level:** {check.confidence_level:.1f}%")
-                        
-                        # Quality scores
-                        col_quality1, col_quality2, col_quality3 = st.columns(3)
-                        with col_quality1:
-                            st.metric("Image Quality", f"{check.image_quality_score:.1f}%")
-                        with col_quality2:
-                            st.metric("Lighting", f"{check.lighting_score:.1f}%")
-                        with col_quality3:
-                            st.metric("Sharpness", f"{check.sharpness_score:.1f}%")
-                        
-                        # Analysis results
-                        if check.text_recognition_results:
-                            st.markdown("**Text Recognition Results:**")
-                            for key, value in check.text_recognition_results.items():
-                                if isinstance(value, bool):
-                                    icon = "✅" if value else "❌"
-                                    st.write(f"{icon} {key.replace('_', ' ').title()}")
-                                else:
-                                    st.write(f"**{key.replace('_', ' ').title()}:** {value}")
-                        
-                        if check.compliance_analysis:
-                            st.markdown("**Compliance Analysis:**")
-                            for key, value in check.compliance_analysis.items():
-                                if isinstance(value, bool):
-                                    icon = "✅" if value else "❌"
-                                    st.write(f"{icon} {key.replace('_', ' ').title()}")
-                                else:
-                                    st.write(f"**{key.replace('_', ' ').title()}:** {value}")
-                        
-                        if check.detected_issues:
-                            st.warning("**Detected Issues:**")
-                            for issue in check.detected_issues:
-                                st.write(f"• {issue}")
+                    if check.detected_issues:
+                        st.warning("**Detected Issues:**")
+                        st.markdown("  \n".join(f"• {issue}" for issue in check.detected_issues))
                 
-                with col2:
-                    # Check actions
-                    if check.status == VisionCheckStatus.PENDING:
-                        if st.button("▶️ Execute", key=f"execute_check_{check.check_id}"):
-                            if physical_integration_manager.execute_vision_check(check.check_id):
-                                st.success("Vision check executed successfully!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to execute vision check")
+            with col2:
+                # Check actions
+                if check.status == VisionCheckStatus.PENDING:
+                    if st.button("▶️ Execute", key=f"execute_check_{check.check_id}"):
+                        if physical_integration_manager.execute_vision_check(check.check_id):
+                            st.toast("Vision check executed successfully!", icon="✅")
+                            st.rerun(scope="fragment")
+                        else:
+                            st.error("Failed to execute vision check")
                     
-                    if check.status == VisionCheckStatus.PASSED:
-                        st.success("✅ Check passed")
+                if check.status == VisionCheckStatus.PASSED:
+                    st.success("✅ Check passed")
                     
-                    if check.status == VisionCheckStatus.FAILED:
-                        st.error("❌ Check failed")
-                        if st.button("🔄 Retry", key=f"retry_check_{check.check_id}"):
-                            # Reset check status and retry
-                            check.status = VisionCheckStatus.PENDING
-                            physical_integration_manager._save_vision_checks()
-                            st.success("Check reset for retry")
-                            st.rerun()
+                if check.status == VisionCheckStatus.FAILED:
+                    st.error("❌ Check failed")
+                    if st.button("🔄 Retry", key=f"retry_check_{check.check_id}"):
+                        if physical_integration_manager.reset_vision_check(check.check_id):
+                            st.toast("Check reset for retry", icon="🔄")
+                            st.rerun(scope="fragment")
     else:
         st.info("No vision checks created yet.")
 
-with tab4:
+@st.fragment
+def _dashboard_tab():
     st.subheader("📊 Integration Dashboard")
     
+    if st.button("🔄 Refresh Dashboard"):
+        # Drop cached aggregates and lists so they are rebuilt from the manager
+        _integration_stats.clear()
+        _print_jobs_snapshot.clear()
+        _vision_checks_snapshot.clear()
+        _recent_vision_checks.clear()
+    
     # Get integration statistics
-    stats = physical_integration_manager.get_integration_statistics()
+    stats = _integration_stats(physical_integration_manager.version)
+    print_jobs = _print_jobs_snapshot(physical_integration_manager.print_jobs_version)
     
     # Overview metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -770,135 +796,55 @@ with tab4:
     with col1:
         st.subheader("📈 Device Status Distribution")
         if stats["devices_by_status"]:
-            device_status_df = pd.DataFrame(list(stats["devices_by_status"].items()), columns=["Status", "Count"])
-            st.bar_chart(device_status_df.set_index("Status"))
+            st.bar_chart(_status_counts(tuple(stats["devices_by_status"].items())))
         else:
             st.info("No device data available.")
     
     with col2:
         st.subheader("📈 Print Job Status Distribution")
         if stats["jobs_by_status"]:
-            job_status_df = pd.DataFrame(list(stats["jobs_by_status"].items()), columns=["Status", "Count"])
-            st.bar_chart(job_status_df.set_index("Status"))
+            st.bar_chart(_status_counts(tuple(stats["jobs_by_status"].items())))
         else:
             st.info("No print job data available.")
     
     # Recent activity
     st.subheader("🕒 Recent Activity")
     
-    # Recent print jobs
-    recent_jobs = sorted(print_jobs, key=lambda x: x.created_date, reverse=True)[:5]
+    # Recent print jobs (the snapshot is already newest first)
+    recent_jobs = print_jobs[:5]
     if recent_jobs:
-        st.markdown("**Recent Print Jobs:**")
-        for job in recent_jobs:
-            status_icon = {"COMPLETED": "✅", "PENDING": "⏳", "PRINTING": "🖨️", "FAILED": "❌"}.get(job.status.value, "⚪")
-            st.write(f"{status_icon} {job.job_id} - {job.product_sku} ({job.status.value})")
+        st.markdown("  \n".join(["**Recent Print Jobs:**"] + [
+            f"{_RECENT_JOB_ICON.get(job.status.value, '⚪')} {job.job_id} - {job.product_sku} ({job.status.value})"
+            for job in recent_jobs
+        ]))
     
     # Recent vision checks
-    recent_checks = sorted(vision_checks, key=lambda x: x.performed_date, reverse=True)[:5]
+    recent_checks = _recent_vision_checks(physical_integration_manager.vision_version)
     if recent_checks:
-        st.markdown("**Recent Vision Checks:**")
-        for check in recent_checks:
-            status_icon = {"PASSED": "✅", "FAILED": "❌", "PENDING": "⏳", "IN_PROGRESS": "👁️"}.get(check.status.value, "⚪")
-            score_text = f" ({check.compliance_score:.1f}%)" if check.compliance_score > 0 else ""
-            st.write(f"{status_icon} {check.check_id} - {check.product_sku} ({check.status.value}){score_text}")
+        st.markdown("  \n".join(["**Recent Vision Checks:**"] + [
+            f"{_RECENT_CHECK_ICON.get(check.status.value, '⚪')} {check.check_id} - {check.product_sku} ({check.status.value})"
+            + (f" ({check.compliance_score:.1f}%)" if check.compliance_score > 0 else "")
+            for check in recent_checks
+        ]))
 
-with tab5:
+@st.fragment
+def _configuration_tab():
     st.subheader("⚙️ System Configuration")
     
-    # Export options
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📊 Export Device Configuration"):
-            devices_data = []
-            for device in devices:
-                device_dict = {
-                    "device_id": device.device_id,
-                    "device_name": device.device_name,
-                    "device_type": device.device_type.value,
-                    "manufacturer": device.manufacturer,
-                    "model": device.model,
-                    "status": device.status.value,
-                    "ip_address": device.ip_address,
-                    "port": device.port,
-                    "capabilities": device.capabilities,
-                    "config": device.config
-                }
-                devices_data.append(device_dict)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "devices": devices_data
-            }
-            
-            st.download_button(
-                label="Download Device Config",
-                data=safe_json_dumps(export_data, indent=2),
-                file_name=f"device_config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
-    
-    with col2:
-        if st.button("🖨️ Export Print Jobs"):
-            jobs_data = []
-            for job in print_jobs:
-                job_dict = {
-                    "job_id": job.job_id,
-                    "label_id": job.label_id,
-                    "product_sku": job.product_sku,
-                    "device_id": job.device_id,
-                    "status": job.status.value,
-                    "created_by": job.created_by,
-                    "created_date": job.created_date,
-                    "copies": job.copies,
-                    "success_count": job.success_count,
-                    "failure_count": job.failure_count
-                }
-                jobs_data.append(job_dict)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "print_jobs": jobs_data
-            }
-            
-            st.download_button(
-                label="Download Print Jobs",
-                data=safe_json_dumps(export_data, indent=2),
-                file_name=f"print_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
+    devices = _devices_snapshot(physical_integration_manager.devices_version)
+    vision_checks = _vision_checks_snapshot(physical_integration_manager.vision_version)
     
-    with col3:
-        if st.button("👁️ Export Vision Checks"):
-            checks_data = []
-            for check in vision_checks:
-                check_dict = {
-                    "check_id": check.check_id,
-                    "product_sku": check.product_sku,
-                    "status": check.status.value,
-                    "performed_by": check.performed_by,
-                    "performed_date": check.performed_date,
-                    "compliance_score": check.compliance_score,
-                    "confidence_level": check.confidence_level,
-                    "detected_issues": check.detected_issues
-                }
-                checks_data.append(check_dict)
-            
-            export_data = {
-                "export_timestamp": datetime.now().isoformat(),
-                "exported_by": current_user.username,
-                "vision_checks": checks_data
-            }
-            
-            st.download_button(
-                label="Download Vision Checks",
-                data=safe_json_dumps(export_data, indent=2),
-                file_name=f"vision_checks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json"
-            )
+    # Export options
+    for column, (kind, button_label, download_label, file_prefix) in zip(st.columns(3), _EXPORT_BUTTONS):
+        with column:
+            if st.button(button_label):
+                version = getattr(physical_integration_manager, _EXPORTS[kind][1])
+                st.download_button(
+                    label=download_label,
+                    data=_export_payload(kind, version, current_user.username),
+                    file_name=f"{file_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                    mime="application/json"
+                )
     
     # System health
     st.subheader("🏥 System Health")
@@ -908,7 +854,7 @@ with tab5:
     
     with col1:
         st.markdown("**Device Health:**")
-        healthy_devices = len([d for d in devices if d.status == IntegrationStatus.CONNECTED and d.error_count == 0])
+        healthy_devices = sum(1 for d in devices if d.status is IntegrationStatus.CONNECTED and d.error_count == 0)
         total_devices = len(devices)
         health_percentage = (healthy_devices / total_devices) * 100 if total_devices > 0 else 0
         
@@ -921,8 +867,9 @@ with tab5:
     
     with col2:
         st.markdown("**System Performance:**")
-        valid_scores = [c.compliance_score for c in vision_checks if c.compliance_score > 0] if vision_checks else []
-        avg_compliance_score = sum(valid_scores) / len(valid_scores) if valid_scores else 0
+        scores = np.fromiter((c.compliance_score for c in vision_checks), dtype=float, count=len(vision_checks))
+        valid_scores = scores[scores > 0]
+        avg_compliance_score = float(valid_scores.mean()) if valid_scores.size else 0
         
         st.metric("Avg Compliance Score", f"{avg_compliance_score:.1f}%")
         
@@ -933,6 +880,30 @@ with tab5:
         else:
             st.error("❌ Low compliance performance")
 
+# Create tabs for different integration functions
+tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    "🖥️ Device Management", 
+    "🖨️ Print Operations", 
+    "👁️ Vision Inspection", 
+    "📊 Integration Dashboard",
+    "⚙️ System Configuration"
+])
+
+with tab1:
+    _device_tab()
+
+with tab2:
+    _print_tab()
+
+with tab3:
+    _vision_tab()
+
+with tab4:
+    _dashboard_tab()
+
+with tab5:
+    _configuration_tab()
+
 # Log page access
 log_user_action(
     current_user.username,
@@ -12,6 +12,38 @@ from core.json_utils import safe_json_dumps
 
 st.set_page_config(page_title="Barcode Scanner - Legal Metrology Checker", page_icon="📷", layout="wide")
 
+RULES_PATH = "app/data/rules/legal_metrology_rules.yaml"
+
+# Parsed once per process and shared read-only by every session (validate never mutates it)
+@st.cache_resource(show_spinner=False)
+def _get_rules(path):
+    return load_rules(path)
+
+# API keys are read when the scanner singleton is built, so availability only
+# changes with a restart; the TTL just bounds how stale the badges can get
+@st.cache_data(ttl="300s", show_spinner=False)
+def _api_info():
+    return get_barcode_scanner().get_available_apis()
+
+@st.cache_data(show_spinner=False)
+def _api_badges_html(api_info):
+    api_badges = []
+    for api_name, info in api_info.items():
+        if info['available']:
+            if info['free']:
+                badge_class = "available"
+                status = "✅ Free"
+            else:
+                badge_class = "premium"
+                status = "🔑 Premium (API Key Configured)"
+        else:
+            badge_class = "unavailable"
+            status = "❌ Requires API Key"
+        
+        api_badges.append(f'<span class="api-badge {badge_class}">{info["name"]}: {status}</span>')
+    
+    return f'<div class="api-status">{"".join(api_badges)}</div>'
+
 # Enhanced Custom CSS for Barcode Scanner Page
 st.markdown("""
 <style>
@@ -139,24 +171,9 @@ st.markdown('<div class="scanner-container">', unsafe_allow_html=True)
 
 # Display API status
 st.markdown("### 🔌 Available Barcode APIs")
-api_info = scanner.get_available_apis()
-
-api_badges = []
-for api_name, info in api_info.items():
-    if info['available']:
-        if info['free']:
-            badge_class = "available"
-            status = "✅ Free"
-        else:
-            badge_class = "premium"
-            status = "🔑 Premium (API Key Configured)"
-    else:
-        badge_class = "unavailable"
-        status = "❌ Requires API Key"
-    
-    api_badges.append(f'<span class="api-badge {badge_class}">{info["name"]}: {status}</span>')
+api_info = _api_info()
 
-st.markdown(f'<div class="api-status">{"".join(api_badges)}</div>', unsafe_allow_html=True)
+st.markdown(_api_badges_html(api_info), unsafe_allow_html=True)
 
 # Show configuration help if premium APIs are not configured
 premium_apis_missing = any(not info['available'] and not info['free'] for info in api_info.values())
@@ -412,7 +429,7 @@ if st.session_state.current_barcode_data:
     
     with st.spinner("Validating compliance..."):
         # Load rules and validate
-        rules = load_rules("app/data/rules/legal_metrology_rules.yaml")
+        rules = _get_rules(RULES_PATH)
         validation_result = validate(extracted_fields, rules)
     
     # Display compliance status
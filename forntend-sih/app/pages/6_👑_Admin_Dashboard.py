@@ -3,7 +3,7 @@ import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from core.auth import AuthManager, UserRole, require_admin, get_current_user
+from core.auth import get_auth_manager, UserRole, require_admin, get_current_user, logout_user
 from core.audit_logger import audit_logger, log_user_action
 from core.system_monitor import system_monitor
 from core.json_utils import safe_json_dumps
@@ -191,7 +191,7 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
-auth_manager = AuthManager()
+auth_manager = get_auth_manager()
 
 # Create tabs for different admin functions
 tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["📊 System Health", "👥 User Management", "📈 System Analytics", "⚙️ System Settings", "📋 Reports Overview", "🔧 Maintenance", "📝 Audit Logs", "📋 Quick Complaints"])
@@ -764,6 +764,5 @@ with tab8:
 # Logout button
 st.markdown("---")
 if st.button("Logout", type="secondary"):
-    if "user" in st.session_state:
-        del st.session_state.user
+    logout_user()
     st.rerun()
@@ -3,7 +3,7 @@ import pandas as pd
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from core.auth import require_auth, get_current_user
+from core.auth import require_auth, get_current_user, logout_user
 
 st.set_page_config(page_title="User Dashboard - Legal Metrology Checker", page_icon="👤", layout="wide")
 
@@ -381,6 +381,5 @@ with col4:
 # Logout button
 st.markdown("---")
 if st.button("Logout", type="secondary"):
-    if "user" in st.session_state:
-        del st.session_state.user
+    logout_user()
     st.rerun()
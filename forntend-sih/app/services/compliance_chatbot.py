@@ -6,7 +6,7 @@ Provides intelligent assistance with context-grounded responses
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -155,64 +155,95 @@ Remember: Your responses must be grounded in the provided context. If the contex
         
         return messages
     
+    def _prepare_chat(self, user_input: str) -> Tuple[List[Dict[str, str]], str]:
+        """Record the user message and build the OpenAI messages and RAG context for it"""
+        # Add user message to history
+        self._add_message(MessageType.USER, user_input)
+        
+        # Get relevant context from RAG index
+        context = ""
+        if self.rag_index:
+            try:
+                context = self.rag_index.get_context(user_input)
+                logger.debug(f"Retrieved context of {len(context)} characters")
+            except Exception as e:
+                logger.error(f"Error retrieving context: {e}")
+                context = "Context retrieval failed. Providing response based on general knowledge."
+        else:
+            context = "RAG index not available. Providing response based on general knowledge."
+        
+        # Build messages for OpenAI
+        messages = [
+            {"role": "system", "content": self._get_system_prompt().format(context=context)}
+        ]
+        
+        # Add conversation history
+        messages.extend(self._get_conversation_context())
+        
+        # Add current user input (if not already in history)
+        if not messages or messages[-1]["content"] != user_input:
+            messages.append({"role": "user", "content": user_input})
+        
+        return messages, context
+    
+    def _create_completion(self, messages: List[Dict[str, str]], stream: bool = False):
+        """Send the conversation to OpenAI"""
+        return self.client.chat.completions.create(
+            model=self.settings.openai_chat_model,
+            messages=messages,
+            max_tokens=self.settings.openai_max_tokens,
+            temperature=self.settings.openai_temperature,
+            top_p=1,
+            frequency_penalty=0.1,
+            presence_penalty=0.1,
+            stream=stream
+        )
+    
+    def _record_response(self, assistant_response: str, context: str) -> None:
+        """Add the assistant response to history"""
+        self._add_message(
+            MessageType.ASSISTANT, 
+            assistant_response,
+            context_used=context[:200] + "..." if len(context) > 200 else context,
+            confidence=1.0  # Could be improved with actual confidence scoring
+        )
+        
+        logger.info(f"Generated response of {len(assistant_response)} characters")
+    
     def chat(self, user_input: str) -> str:
         """Main chat function with RAG-powered responses"""
         try:
-            # Add user message to history
-            self._add_message(MessageType.USER, user_input)
-            
-            # Get relevant context from RAG index
-            context = ""
-            if self.rag_index:
-                try:
-                    context = self.rag_index.get_context(user_input)
-                    logger.debug(f"Retrieved context of {len(context)} characters")
-                except Exception as e:
-                    logger.error(f"Error retrieving context: {e}")
-                    context = "Context retrieval failed. Providing response based on general knowledge."
-            else:
-                context = "RAG index not available. Providing response based on general knowledge."
-            
-            # Build messages for OpenAI
-            messages = [
-                {"role": "system", "content": self._get_system_prompt().format(context=context)}
-            ]
-            
-            # Add conversation history
-            messages.extend(self._get_conversation_context())
-            
-            # Add current user input (if not already in history)
-            if not messages or messages[-1]["content"] != user_input:
-                messages.append({"role": "user", "content": user_input})
+            messages, context = self._prepare_chat(user_input)
             
             # Get response from OpenAI
-            response = self.client.chat.completions.create(
-                model=self.settings.openai_chat_model,
-                messages=messages,
-                max_tokens=self.settings.openai_max_tokens,
-                temperature=self.settings.openai_temperature,
-                top_p=1,
-                frequency_penalty=0.1,
-                presence_penalty=0.1
-            )
+            response = self._create_completion(messages)
             
             assistant_response = response.choices[0].message.content.strip()
-            
-            # Add assistant response to history
-            self._add_message(
-                MessageType.ASSISTANT, 
-                assistant_response,
-                context_used=context[:200] + "..." if len(context) > 200 else context,
-                confidence=1.0  # Could be improved with actual confidence scoring
-            )
-            
-            logger.info(f"Generated response of {len(assistant_response)} characters")
+            self._record_response(assistant_response, context)
             return assistant_response
         
         except Exception as e:
             logger.error(f"Error in chat function: {e}")
             return self._get_fallback_response(user_input, str(e))
     
+    def chat_stream(self, user_input: str) -> Iterator[str]:
+        """Same as chat, but yields the response text as OpenAI streams it back"""
+        parts = []
+        try:
+            messages, context = self._prepare_chat(user_input)
+            
+            for chunk in self._create_completion(messages, stream=True):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            
+            self._record_response("".join(parts).strip(), context)
+        
+        except Exception as e:
+            logger.error(f"Error in chat stream: {e}")
+            yield ("\n\n" if parts else "") + self._get_fallback_response(user_input, str(e))
+    
     def analyze_validation(self, validation_result: Dict[str, Any], extracted_fields: Dict[str, Any]) -> str:
         """Analyze validation results with RAG-powered insights"""
         try:
@@ -1,6 +1,6 @@
 import streamlit as st
 from pathlib import Path
-from core.auth import is_authenticated, get_current_user, is_admin, UserRole
+from core.auth import is_authenticated, get_current_user, is_admin, logout_user, UserRole
 
 st.set_page_config(page_title="Legal Metrology Compliance Checker", page_icon="⚖️", layout="wide")
 
@@ -419,8 +419,7 @@ with col3:
     """, unsafe_allow_html=True)
     
     if st.button("🚪 Logout", key="logout_btn", type="secondary"):
-        if "user" in st.session_state:
-            del st.session_state.user
+        logout_user()
         st.rerun()
 
 # System status indicator